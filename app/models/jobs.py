@@ -0,0 +1,89 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, text
+from app.config.database import kagapa_tools_db as db
+from app.models.spellcheck import ist_now
+
+
+# ======================================================
+# Upload Jobs (documents processed in the background)
+# ======================================================
+class UploadJob(db.Model):
+    __tablename__ = "upload_jobs"
+    __table_args__ = {
+        "mysql_engine": "InnoDB",
+        "mysql_charset": "utf8mb4",
+        "mysql_collate": "utf8mb4_unicode_ci"
+    }
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    # uuid4 hex, handed out to the client
+    id = Column(String(32), primary_key=True)
+
+    # Handler name, e.g. "user_dictionary_upload" / "sort_doc"
+    kind = Column(String(50), nullable=False, index=True)
+
+    status = Column(
+        String(20),
+        nullable=False,
+        default=QUEUED,
+        server_default=text("'queued'"),
+        index=True
+    )
+
+    progress = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0")
+    )
+
+    message = Column(String(255), nullable=True)
+
+    filename = Column(String(255), nullable=False)
+
+    # Saved upload, removed once the job has run
+    file_path = Column(String(500), nullable=False)
+
+    # Handler arguments (added_by, flags, ...)
+    params = Column(JSON, nullable=True)
+
+    result = Column(JSON, nullable=True)
+
+    error = Column(Text, nullable=True)
+
+    created_by = Column(String(100), nullable=True)
+
+    # host:pid:token of the process running the job
+    worker = Column(String(100), nullable=True)
+
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=ist_now,
+        server_default=text("CURRENT_TIMESTAMP")
+    )
+
+    started_at = Column(DateTime(timezone=True), nullable=True)
+
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "filename": self.filename,
+            "error": self.error,
+            "created_by": self.created_by,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def __repr__(self):
+        return f"<UploadJob id='{self.id}' kind='{self.kind}' status='{self.status}'>"
@@ -0,0 +1,58 @@
+from flask import Blueprint, request, jsonify
+
+from app.models.jobs import UploadJob
+from app.security.jwt_decorators import login_required
+from app.services.jobs.upload_job_service import UploadJobService
+from app.utils.logger import setup_logger
+
+logger = setup_logger(name="UploadJobRoutes")
+
+upload_jobs_bp = Blueprint("upload_jobs", __name__)
+
+
+def _get_own_job(job_id: str) -> UploadJob | None:
+    """
+    The job, if the logged-in user created it or is an admin. Other
+    users' jobs are reported as missing so job ids cannot be probed.
+    """
+    job = UploadJobService.get(job_id)
+    if job is None:
+        return None
+    if request.user.get("role") == "admin":
+        return job
+    if job.created_by and job.created_by == request.user.get("username"):
+        return job
+    return None
+
+
+# -------------------------------------------------
+# JOB STATUS / PROGRESS
+# -------------------------------------------------
+@upload_jobs_bp.route("/<job_id>", methods=["GET"])
+@login_required
+def get_job_status(job_id):
+    job = _get_own_job(job_id)
+    if job is None:
+        return jsonify({"error": "job not found"}), 404
+    return jsonify(UploadJobService.describe(job))
+
+
+# -------------------------------------------------
+# JOB RESULT
+# -------------------------------------------------
+@upload_jobs_bp.route("/<job_id>/result", methods=["GET"])
+@login_required
+def get_job_result(job_id):
+    """
+    200 with the upload result once the job succeeded, 202 with the job
+    status while it is queued or running, 422 with the error if it failed.
+    """
+    job = _get_own_job(job_id)
+    if job is None:
+        return jsonify({"error": "job not found"}), 404
+
+    if job.status == UploadJob.SUCCEEDED:
+        return jsonify(job.result)
+    if job.status == UploadJob.FAILED:
+        return jsonify(UploadJobService.describe(job)), 422
+    return jsonify(UploadJobService.describe(job)), 202
@@ -1,13 +1,31 @@
 import os
 import urllib.parse
 from flask import Blueprint, request, jsonify, send_file, abort
-from app.services.sortwords.sort_doc_service import allowed_file, process_uploaded_file, BASE_RESULT_FOLDER
+from app.security.jwt_utils import decode_jwt
+from app.services.jobs.upload_job_service import UploadJobService
+from app.services.sortwords.sort_doc_service import (
+    allowed_file,
+    process_uploaded_batch,
+    process_uploaded_file,
+    BASE_RESULT_FOLDER,
+)
 from app.utils.logger import setup_logger
 
 sort_doc_bp = Blueprint("sort_doc", __name__)
 logger = setup_logger('sort-doc-routes')
 
 
+def _current_username():
+    """Username from the access_token cookie, or None when not logged in."""
+    token = request.cookies.get("access_token")
+    if not token:
+        return None
+    try:
+        return decode_jwt(token).get("username")
+    except Exception:
+        return None
+
+
 @sort_doc_bp.route("/upload", methods=["POST"])
 def sort_doc_api_upload():
     if "file" not in request.files:
@@ -19,10 +37,40 @@ def sort_doc_api_upload():
     if not filename or not allowed_file(filename):
         return jsonify({"error": "Only .docx and .txt files are allowed"}), 400
 
+    # async=1: process in a background job, poll /api/v1/jobs/<job_id>
+    # (jobs are readable by their creator only, so this needs a login)
+    if request.values.get("async", "").lower() in ("1", "true", "yes", "on"):
+        username = _current_username()
+        if not username:
+            return jsonify({"error": "Login required for async uploads"}), 401
+        try:
+            job = UploadJobService.submit("sort_doc", file, filename, created_by=username)
+        except RuntimeError as e:
+            return jsonify({"error": str(e)}), 503
+        return jsonify(UploadJobService.describe(job)), 202
+
     result = process_uploaded_file(file, filename)
     return jsonify(result)
 
 
+@sort_doc_bp.route("/upload-batch", methods=["POST"])
+def sort_doc_api_upload_batch():
+    """
+    Sort several files (field "files", repeatable) or a .zip of .docx/.txt
+    files into one merged lowest/highest result with per-file stats.
+    """
+    files = [f for f in request.files.getlist("files") if f and f.filename]
+    if not files:
+        return jsonify({"error": "No files uploaded"}), 400
+
+    try:
+        result = process_uploaded_batch([(f, f.filename) for f in files])
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify(result)
+
+
 @sort_doc_bp.route("/download/<date>/<path:filename>", methods=["GET"])
 def download_result(date, filename):
     filename = urllib.parse.unquote(filename)
@@ -0,0 +1,109 @@
+from flask import Blueprint, request, jsonify
+
+from app.security.jwt_decorators import login_required
+from app.services.spellcheck.autocomplete_service import AutocompleteService, DEFAULT_COMPLETIONS
+from app.services.spellcheck.dictionary_lookup_service import DictionaryLookupService
+from app.services.spellcheck.main_dictionary_service import BATCH_MAX_WORDS
+from app.services.spellcheck.suggestion_service import SuggestionService, DEFAULT_METRIC, DEFAULT_SUGGESTIONS
+from app.utils.logger import setup_logger
+from app.utils.utils import word_list_error
+
+logger = setup_logger(name="DictionaryLookupRoutes")
+
+dictionary_lookup_bp = Blueprint(
+    "dictionary_lookup",
+    __name__
+)
+
+
+# -------------------------------------------------
+# LOOKUP WORD(S) – verified / pending / unknown
+# -------------------------------------------------
+@dictionary_lookup_bp.route("/lookup", methods=["POST"])
+@login_required
+def lookup_words():
+    data = request.get_json() or {}
+    words = data.get("words") or data.get("word")
+
+    if not words:
+        logger.warning("Lookup failed: no word(s) provided")
+        return jsonify({"error": "word or words is required"}), 400
+
+    # "word" is a single string, "words" a list of strings
+    if isinstance(words, str) and not data.get("words"):
+        words = [words]
+    error = word_list_error(words, BATCH_MAX_WORDS)
+    if error:
+        return jsonify({"error": error}), 400
+
+    result = DictionaryLookupService.lookup(words)
+
+    logger.info(
+        "Dictionary lookup | words=%s | counts=%s",
+        len(result["results"]),
+        result["counts"]
+    )
+
+    return jsonify(result)
+
+
+# -------------------------------------------------
+# SPELLING SUGGESTIONS (code point / akshara edit distance, then frequency)
+# -------------------------------------------------
+@dictionary_lookup_bp.route("/suggest", methods=["GET"])
+@login_required
+def suggest_words():
+    word = (request.args.get("word") or "").strip()
+    if not word:
+        return jsonify({"error": "word is required"}), 400
+
+    limit = request.args.get("limit", DEFAULT_SUGGESTIONS, type=int)
+    max_distance = request.args.get("max_distance", type=int)
+    metric = request.args.get("metric", DEFAULT_METRIC)
+
+    try:
+        # Indexes other than the default one are built on first use
+        if not SuggestionService.is_ready(metric):
+            return jsonify({"error": f"Suggestion index ({metric}) is still loading"}), 503
+
+        result = SuggestionService.suggest(word, limit=limit, max_distance=max_distance, metric=metric)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    logger.info(
+        "Suggestions | word=%s | found=%s",
+        result["word"],
+        len(result["suggestions"])
+    )
+
+    return jsonify(result)
+
+
+@dictionary_lookup_bp.route("/suggest/stats", methods=["GET"])
+@login_required
+def suggest_stats():
+    return jsonify(SuggestionService.stats())
+
+
+# -------------------------------------------------
+# AUTOCOMPLETE (prefix, ranked by frequency)
+# -------------------------------------------------
+@dictionary_lookup_bp.route("/autocomplete", methods=["GET"])
+@login_required
+def autocomplete_words():
+    prefix = (request.args.get("prefix") or "").strip()
+    if not prefix:
+        return jsonify({"error": "prefix is required"}), 400
+
+    limit = request.args.get("limit", DEFAULT_COMPLETIONS, type=int)
+
+    if not AutocompleteService.is_ready():
+        return jsonify({"error": "Autocomplete index is still loading"}), 503
+
+    return jsonify(AutocompleteService.complete(prefix, limit=limit))
+
+
+@dictionary_lookup_bp.route("/autocomplete/stats", methods=["GET"])
+@login_required
+def autocomplete_stats():
+    return jsonify(AutocompleteService.stats())
@@ -1,9 +1,16 @@
 from flask import Blueprint, request, jsonify
 
-from app.services.spellcheck.main_dictionary_service import MainDictionaryService
+from app.services.spellcheck.main_dictionary_service import (
+    MainDictionaryService,
+    BATCH_MAX_WORDS,
+    main_frequency_buffer,
+    main_word_cache,
+)
+from app.services.spellcheck.user_dictionary_service import user_word_cache
+from app.services.spellcheck.warmup_service import DictionaryWarmupService
 from app.security.jwt_decorators import login_required
 from app.utils.logger import setup_logger
-from app.utils.utils import MainDictionaryBloom
+from app.utils.utils import MainDictionaryBloom, word_list_error
 
 logger = setup_logger(name="MainDictionaryRoutes")
 
@@ -36,10 +43,11 @@ def add_words():
     result = MainDictionaryService.create(words, added_by)
 
     logger.info(
-        "Add words result | added_by=%s | created=%s | skipped=%s",
+        "Add words result | added_by=%s | created=%s | skipped=%s | invalid=%s",
         added_by,
         result.get("created"),
-        result.get("skipped")
+        result.get("skipped"),
+        result.get("invalid")
     )
 
     return jsonify(result), 201
@@ -181,6 +189,40 @@ def check_word(word):
     })
 
 
+# -------------------------------------------------
+# BATCH CHECK – whole text OR word list
+# -------------------------------------------------
+@main_dictionary_bp.route("/check", methods=["POST"])
+@login_required
+def check_words_batch():
+    data = request.get_json() or {}
+    text = data.get("text")
+    words = data.get("words")
+
+    if text is None and not words:
+        logger.warning("Batch check failed: no text or words provided")
+        return jsonify({"error": "text or words is required"}), 400
+
+    if text is not None and not isinstance(text, str):
+        return jsonify({"error": "text must be a string"}), 400
+
+    if text is None:
+        error = word_list_error(words, BATCH_MAX_WORDS)
+        if error:
+            return jsonify({"error": error}), 400
+
+    result = MainDictionaryService.check_batch(text=text, words=words)
+
+    logger.info(
+        "Batch word check | tokens=%s | unique=%s | unknown=%s",
+        result["total_tokens"],
+        result["unique_words"],
+        result["unknown_count"]
+    )
+
+    return jsonify(result)
+
+
 # -------------------------------------------------
 # INIT / RELOAD BLOOM FILTER
 # -------------------------------------------------
@@ -216,3 +258,38 @@ def bloom_stats():
     )
 
     return jsonify(stats)
+
+
+# -------------------------------------------------
+# WORD LOOKUP CACHE STATS
+# -------------------------------------------------
+@main_dictionary_bp.route("/cache/stats", methods=["GET"])
+@login_required
+def word_cache_stats():
+    logger.info(
+        "Word cache stats requested | requested_by=%s",
+        request.user.get("username")
+    )
+
+    return jsonify({
+        "main_dictionary": main_word_cache.stats(),
+        "user_dictionary": user_word_cache.stats()
+    })
+
+
+# -------------------------------------------------
+# READINESS (load balancer probe, no auth)
+# -------------------------------------------------
+@main_dictionary_bp.route("/ready", methods=["GET"])
+def readiness():
+    status = DictionaryWarmupService.status()
+    return jsonify(status), 200 if status["ready"] else 503
+
+
+# -------------------------------------------------
+# FREQUENCY WRITE-BEHIND BUFFER STATS
+# -------------------------------------------------
+@main_dictionary_bp.route("/frequency/stats", methods=["GET"])
+@login_required
+def frequency_buffer_stats():
+    return jsonify(main_frequency_buffer.stats())
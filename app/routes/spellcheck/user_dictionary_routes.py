@@ -1,9 +1,9 @@
 from flask import Blueprint, request, jsonify, render_template
-from sqlalchemy import or_
 from werkzeug.utils import secure_filename
 
 from app.models.spellcheck import UserAddedWord
 from app.security.jwt_decorators import login_required
+from app.services.jobs.upload_job_service import UploadJobService
 from app.services.spellcheck.user_dictionary_service import (
     UserDictionaryService,
     UserDictionaryBulkUploadService,
@@ -20,6 +20,13 @@ user_dictionary_bp = Blueprint(
 )
 
 
+def _flag(value) -> bool:
+    """Read a boolean from JSON or form data ("1", "true", "yes", "on")."""
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in ("1", "true", "yes", "on")
+
+
 def _get_ext(filename: str) -> str:
     """
     Return allowed extension ('.txt' / '.docx') or ''.
@@ -44,11 +51,12 @@ def add_user_words():
     data = request.get_json() or {}
     words = data.get("words") or data.get("word")
     added_by = data.get("added_by")
+    bump_main_frequency = _flag(data.get("bump_main_frequency"))
 
     if not words:
         return jsonify({"error": "word or words is required"}), 400
 
-    result = UserDictionaryService.add(words, added_by)
+    result = UserDictionaryService.add(words, added_by, bump_main_frequency=bump_main_frequency)
     return jsonify(result), 201
 
 @user_dictionary_bp.route("/pending", methods=["GET"])
@@ -61,6 +69,8 @@ def list_pending_words():
       - limit: page size
       - offset: start index
       - search: optional search term (applied to word and added_by)
+      - min_frequency: optional minimum frequency
+      - added_by: optional exact contributor
     """
     try:
         limit = int(request.args.get("limit", 10))
@@ -70,19 +80,12 @@ def list_pending_words():
         offset = 0
 
     search_term = (request.args.get("search") or "").strip()
+    min_frequency = request.args.get("min_frequency", type=int)
+    added_by = (request.args.get("added_by") or "").strip()
 
-    base_q = UserAddedWord.query.filter_by(verified=False)
-
-    if search_term:
-        like_term = f"%{search_term}%"
-        base_q = base_q.filter(
-            or_(
-                UserAddedWord.word.ilike(like_term),
-                UserAddedWord.added_by.ilike(like_term),
-            )
-        )
+    base_q = UserDictionaryService.pending_query(search_term, min_frequency, added_by)
 
-    total_pending = UserAddedWord.query.filter_by(verified=False).count()
+    total_pending = UserDictionaryService.pending_query().count()
     filtered_count = base_q.count()
 
     words = (
@@ -147,6 +150,37 @@ def approve_words():
     return jsonify(result)
 
 
+@user_dictionary_bp.route("/approve-filter", methods=["POST"])
+@login_required
+def approve_pending_by_filter():
+    """
+    Approve every pending word matching the /pending criteria
+    (search, min_frequency, added_by). dry_run only counts them.
+    """
+    data = request.get_json() or {}
+
+    try:
+        min_frequency = data.get("min_frequency")
+        min_frequency = int(min_frequency) if min_frequency not in (None, "") else None
+    except (TypeError, ValueError):
+        return jsonify({"error": "min_frequency must be an integer"}), 400
+
+    admin_name = request.user.get("username")
+
+    try:
+        result = UserDictionaryService.approve_pending(
+            search=(data.get("search") or "").strip(),
+            min_frequency=min_frequency,
+            added_by=(data.get("added_by") or "").strip(),
+            admin_name=admin_name,
+            dry_run=_flag(data.get("dry_run")),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify(result)
+
+
 # -------------------------------------------------
 # 📄 FILE UPLOAD → EXTRACT WORDS & UPDATE FREQUENCY
 # -------------------------------------------------
@@ -156,6 +190,9 @@ def upload_user_dictionary_file():
     """
     Accepts a .txt or .docx file, extracts text, cleans words,
     computes frequencies, and upserts into UserAddedWord.
+
+    With async=1 (query or form) the file is processed by a background
+    job instead: 202 with the job id and its status / result URLs.
     """
     if "file" not in request.files:
         return jsonify({"error": "file field is required"}), 400
@@ -193,12 +230,27 @@ def upload_user_dictionary_file():
     )
 
     added_by = request.form.get("added_by")
+    bump_main_frequency = _flag(request.form.get("bump_main_frequency"))
+
+    if _flag(request.values.get("async")):
+        try:
+            job = UploadJobService.submit(
+                "user_dictionary_upload",
+                file,
+                safe_name,
+                params={"added_by": added_by, "bump_main_frequency": bump_main_frequency},
+                created_by=request.user.get("username"),
+            )
+        except RuntimeError as e:
+            return jsonify({"error": str(e)}), 503
+        return jsonify(UploadJobService.describe(job)), 202
 
     try:
         result = UserDictionaryBulkUploadService.process_file(
             file_obj=file,
             filename=safe_name,  # now e.g. "upload.docx"
             added_by=added_by,
+            bump_main_frequency=bump_main_frequency,
         )
     except ValueError as e:
         logger.error(f"Upload validation error: {e}")
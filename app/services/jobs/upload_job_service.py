@@ -0,0 +1,256 @@
+import os
+import socket
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Lock
+
+from sqlalchemy import update
+from werkzeug.datastructures import FileStorage
+
+from app.config.database import kagapa_tools_db as db
+from app.models.jobs import UploadJob
+from app.models.spellcheck import ist_now
+from app.services.sortwords.sort_doc_service import process_uploaded_file
+from app.services.spellcheck.user_dictionary_service import UserDictionaryBulkUploadService
+from app.utils.logger import setup_logger
+
+logger = setup_logger(name="UploadJobService")
+
+# Jobs run at the same time per process / days finished jobs are kept
+UPLOAD_JOB_WORKERS = int(os.getenv("UPLOAD_JOB_WORKERS", "2"))
+UPLOAD_JOB_RETENTION_DAYS = int(os.getenv("UPLOAD_JOB_RETENTION_DAYS", "7"))
+
+JOB_UPLOAD_FOLDER = os.path.join("user_uploaded", "jobs")
+
+
+def _run_user_dictionary_upload(file, filename: str, params: dict, progress) -> dict:
+    return UserDictionaryBulkUploadService.process_file(
+        file_obj=file,
+        filename=filename,
+        added_by=params.get("added_by"),
+        bump_main_frequency=params.get("bump_main_frequency", False),
+        progress=progress,
+    )
+
+
+def _run_sort_doc(file, filename: str, params: dict, progress) -> dict:
+    return process_uploaded_file(file, filename)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class UploadJobService:
+    """
+    Runs document uploads in a local thread pool instead of the request
+    thread. The upload is saved to disk, an upload_jobs row is created and
+    its id is returned at once; clients poll the row for status and
+    progress, and read the handler's result from it when it succeeds.
+
+    Jobs are claimed with a conditional UPDATE (queued -> running), so a
+    job is run once even if several processes see it queued. At start,
+    queued jobs whose file is on this host are resubmitted and jobs left
+    running by a process that has exited are marked failed.
+
+    Must be started in each worker process (threads do not survive fork).
+    """
+    HANDLERS = {
+        "user_dictionary_upload": _run_user_dictionary_upload,
+        "sort_doc": _run_sort_doc,
+    }
+
+    _lock = Lock()
+    _executor: ThreadPoolExecutor | None = None
+    _app = None
+    _worker_id: str | None = None
+
+    # -------------------------------------------------
+    # START
+    # -------------------------------------------------
+    @classmethod
+    def start(cls, app):
+        with cls._lock:
+            if cls._executor is not None:
+                return
+            cls._app = app
+            cls._worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+            cls._executor = ThreadPoolExecutor(max_workers=UPLOAD_JOB_WORKERS, thread_name_prefix="upload-job")
+        os.makedirs(JOB_UPLOAD_FOLDER, exist_ok=True)
+        cls._executor.submit(cls._recover)
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._executor is not None
+
+    @classmethod
+    def _recover(cls):
+        with cls._app.app_context():
+            try:
+                host = socket.gethostname()
+                for job in UploadJob.query.filter_by(status=UploadJob.RUNNING).all():
+                    worker_host, pid = (job.worker or "::").split(":")[:2]
+                    if worker_host == host and (int(pid or 0) == os.getpid() or not _pid_alive(int(pid or 0))):
+                        cls._finish(job, UploadJob.FAILED, error="Interrupted: the worker process exited")
+
+                for job in UploadJob.query.filter_by(status=UploadJob.QUEUED).all():
+                    if os.path.exists(job.file_path):
+                        cls._executor.submit(cls._run, job.id)
+
+                cutoff = ist_now() - timedelta(days=UPLOAD_JOB_RETENTION_DAYS)
+                purged = (
+                    UploadJob.query
+                    .filter(UploadJob.status.in_([UploadJob.SUCCEEDED, UploadJob.FAILED]))
+                    .filter(UploadJob.finished_at < cutoff)
+                    .delete(synchronize_session=False)
+                )
+                db.session.commit()
+                if purged:
+                    logger.info(f"Purged {purged} upload jobs older than {UPLOAD_JOB_RETENTION_DAYS} days")
+            except Exception as e:
+                db.session.rollback()
+                logger.exception(f"Upload job recovery failed: {e}")
+            finally:
+                db.session.remove()
+
+    # -------------------------------------------------
+    # SUBMIT
+    # -------------------------------------------------
+    @classmethod
+    def submit(
+        cls,
+        kind: str,
+        file,
+        filename: str,
+        params: dict | None = None,
+        created_by: str | None = None
+    ) -> UploadJob:
+        """Save the uploaded file and queue it; returns the new job."""
+        if kind not in cls.HANDLERS:
+            raise ValueError(f"Unknown job kind: {kind!r}")
+        if cls._executor is None:
+            raise RuntimeError("Background upload jobs are not running")
+
+        job_id = uuid.uuid4().hex
+        ext = os.path.splitext(filename)[1].lower()
+        file_path = os.path.join(JOB_UPLOAD_FOLDER, f"{job_id}{ext}")
+        os.makedirs(JOB_UPLOAD_FOLDER, exist_ok=True)
+        file.save(file_path)
+
+        job = UploadJob(
+            id=job_id,
+            kind=kind,
+            filename=filename,
+            file_path=file_path,
+            params=params or {},
+            created_by=created_by,
+            message="Queued",
+        )
+        try:
+            db.session.add(job)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            os.remove(file_path)
+            raise
+
+        cls._executor.submit(cls._run, job_id)
+        logger.info(f"Upload job {job_id} queued ({kind}, {filename!r})")
+        return job
+
+    # -------------------------------------------------
+    # RUN
+    # -------------------------------------------------
+    @classmethod
+    def _run(cls, job_id: str):
+        with cls._app.app_context():
+            try:
+                cls._execute(job_id)
+            except Exception as e:
+                logger.exception(f"Upload job {job_id} crashed: {e}")
+            finally:
+                db.session.remove()
+
+    @classmethod
+    def _execute(cls, job_id: str):
+        claimed = cls._update(
+            job_id,
+            status=UploadJob.RUNNING,
+            worker=cls._worker_id,
+            started_at=ist_now(),
+            message="Running",
+            only_if_status=UploadJob.QUEUED,
+        )
+        if not claimed:
+            return
+
+        job = db.session.get(UploadJob, job_id)
+        handler = cls.HANDLERS[job.kind]
+        logger.info(f"Upload job {job_id} started ({job.kind}, {job.filename!r})")
+
+        def progress(percent: int, message: str):
+            cls._update(job_id, progress=max(0, min(int(percent), 99)), message=message[:255])
+
+        try:
+            with open(job.file_path, "rb") as stream:
+                file = FileStorage(stream=stream, filename=job.filename)
+                result = handler(file, job.filename, job.params or {}, progress)
+        except Exception as e:
+            db.session.rollback()
+            logger.exception(f"Upload job {job_id} failed: {e}")
+            cls._finish(job, UploadJob.FAILED, error=str(e))
+        else:
+            cls._finish(job, UploadJob.SUCCEEDED, result=result)
+            logger.info(f"Upload job {job_id} finished")
+        finally:
+            try:
+                os.remove(job.file_path)
+            except OSError:
+                pass
+
+    @classmethod
+    def _finish(cls, job: UploadJob, status: str, result: dict | None = None, error: str | None = None):
+        cls._update(
+            job.id,
+            status=status,
+            progress=100 if status == UploadJob.SUCCEEDED else job.progress,
+            message="Done" if status == UploadJob.SUCCEEDED else "Failed",
+            result=result,
+            error=error,
+            finished_at=ist_now(),
+        )
+
+    @staticmethod
+    def _update(job_id: str, only_if_status: str | None = None, **values) -> bool:
+        """
+        Update a job row on its own connection, so progress is visible
+        while the handler's transaction is still open.
+        """
+        table = UploadJob.__table__
+        stmt = update(table).where(table.c.id == job_id).values(**values)
+        if only_if_status is not None:
+            stmt = stmt.where(table.c.status == only_if_status)
+        with db.engine.begin() as conn:
+            return conn.execute(stmt).rowcount == 1
+
+    # -------------------------------------------------
+    # STATUS
+    # -------------------------------------------------
+    @staticmethod
+    def get(job_id: str) -> UploadJob | None:
+        return db.session.get(UploadJob, job_id)
+
+    @staticmethod
+    def describe(job: UploadJob) -> dict:
+        return {
+            **job.to_dict(),
+            "status_url": f"/api/v1/jobs/{job.id}",
+            "result_url": f"/api/v1/jobs/{job.id}/result",
+        }
@@ -1,10 +1,18 @@
+import hashlib
+import json
+import multiprocessing
 import os
 import uuid
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from threading import Lock
 import pandas as pd
 from werkzeug.utils import secure_filename
 from app.utils.logger import setup_logger
-from app.utils.word_sort_tools import extract_words_from_file, sort_lowest_highest_words
+from app.utils.word_sort_tools import extract_and_count_file, extract_words_from_file, sort_lowest_highest_words
 
 # Base folder for all results
 BASE_RESULT_FOLDER = os.path.join("user_uploaded", "sorted_results")
@@ -12,6 +20,15 @@ os.makedirs(BASE_RESULT_FOLDER, exist_ok=True)
 
 logger = setup_logger(name='sort-doc')
 
+# Batch uploads: worker processes per web process (default 4, never more
+# than the cores) and limits
+SORT_DOC_WORKERS = max(1, min(int(os.getenv("SORT_DOC_WORKERS", "0")) or 4, os.cpu_count() or 1))
+SORT_DOC_BATCH_MAX_FILES = int(os.getenv("SORT_DOC_BATCH_MAX_FILES", "100"))
+SORT_DOC_BATCH_MAX_MB = int(os.getenv("SORT_DOC_BATCH_MAX_MB", "200"))
+
+_pool = None
+_pool_lock = Lock()
+
 def get_today_folder():
     today_str = datetime.now().strftime("%Y-%m-%d")
     today_folder = os.path.join(BASE_RESULT_FOLDER, today_str)
@@ -32,6 +49,45 @@ def cleanup_old_folders():
                 logger.warning(f"Failed to delete {folder_path}: {e}")
 
 
+def hash_upload(file):
+    """SHA-256 of the uploaded bytes, read in chunks; rewinds the stream."""
+    stream = getattr(file, "stream", file)
+    stream.seek(0)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def load_cached_result(today_folder, content_hash):
+    """
+    Result of an earlier upload of the same bytes today, if its files
+    still exist. Results live next to the CSVs, so they expire with them.
+    """
+    cache_path = os.path.join(today_folder, f"{content_hash}.json")
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not all(os.path.isfile(os.path.join(today_folder, name)) for name in cached["files"]):
+        return None
+    return cached["result"]
+
+
+def save_cached_result(today_folder, content_hash, result, files):
+    cache_path = os.path.join(today_folder, f"{content_hash}.json")
+    tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"result": result, "files": files}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not cache sort-doc result {cache_path}: {e}")
+
+
 def allowed_file(filename):
     return filename.lower().endswith(('.docx', '.txt'))
 
@@ -45,21 +101,35 @@ def create_csv(words_list, prefix, folder="."):
     return filename, filepath
 
 
-def process_uploaded_file(file, original_filename):
-    cleanup_old_folders()
-
-    today_folder = get_today_folder()
-    today_str = os.path.basename(today_folder)
-
+def save_upload(file, original_filename, folder):
+    """Save an upload under a short safe name; returns (base_name, saved_filename)."""
     raw_name, ext = os.path.splitext(original_filename)
     safe_name = secure_filename(raw_name) or "file"
     base_name = safe_name[:10]
     ext = ext.lstrip(".") or "docx"
 
     saved_filename = f"{base_name}_{uuid.uuid4().hex}.{ext}"
-    saved_file_path = os.path.join(today_folder, saved_filename)
+    saved_file_path = os.path.join(folder, saved_filename)
     file.save(saved_file_path)
     logger.info(f"Uploaded file saved: {saved_file_path}")
+    return base_name, saved_filename
+
+
+def process_uploaded_file(file, original_filename):
+    cleanup_old_folders()
+
+    today_folder = get_today_folder()
+    today_str = os.path.basename(today_folder)
+
+    # Same bytes uploaded again today: reuse the earlier CSVs
+    content_hash = hash_upload(file)
+    cached = load_cached_result(today_folder, content_hash)
+    if cached is not None:
+        logger.info(f"Sort-doc cache hit for {original_filename!r} ({content_hash[:12]})")
+        return {**cached, "cached": True}
+
+    base_name, saved_filename = save_upload(file, original_filename, today_folder)
+    saved_file_path = os.path.join(today_folder, saved_filename)
 
     words_unique, total_count = extract_words_from_file(saved_file_path)
     lowest, highest, min_len, max_len = sort_lowest_highest_words(words_unique)
@@ -70,7 +140,7 @@ def process_uploaded_file(file, original_filename):
     logger.info(f"Lowest words CSV: {lowest_path}")
     logger.info(f"Highest words CSV: {highest_path}")
 
-    return {
+    result = {
         "original_file": f"/api/v1/sort-doc/download/{today_str}/{os.path.basename(saved_filename)}",
         "total_word_count": total_count,
         "unique_word_count": len(words_unique),
@@ -79,3 +149,200 @@ def process_uploaded_file(file, original_filename):
         "download_lowest_url": f"/api/v1/sort-doc/download/{today_str}/{os.path.basename(lowest_file)}",
         "download_highest_url": f"/api/v1/sort-doc/download/{today_str}/{os.path.basename(highest_file)}",
     }
+    save_cached_result(today_folder, content_hash, result, [saved_filename, lowest_file, highest_file])
+
+    return {**result, "cached": False}
+
+
+# ======================================================
+# BATCH: many files or a .zip, parsed in a process pool
+# ======================================================
+def _get_pool():
+    """
+    Process pool shared by batch uploads. Workers are not forked from the
+    web process, whose threads may hold locks and whose DB sockets and
+    mapped files would be inherited: they start from a forkserver (spawn
+    where that is missing) and only import app.utils.word_sort_tools to
+    run extract_and_count_file. run.py skips building the app when a
+    worker imports it as __mp_main__.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload(["app.utils.word_sort_tools"])
+            else:
+                context = multiprocessing.get_context("spawn")
+            _pool = ProcessPoolExecutor(max_workers=SORT_DOC_WORKERS, mp_context=context)
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _upload_size(file):
+    """Size in bytes of an uploaded file; rewinds the stream."""
+    stream = getattr(file, "stream", file)
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    return size
+
+
+def _check_batch_limits(file_count, total_bytes):
+    if file_count > SORT_DOC_BATCH_MAX_FILES:
+        raise ValueError(f"At most {SORT_DOC_BATCH_MAX_FILES} files can be sorted at once")
+    if total_bytes > SORT_DOC_BATCH_MAX_MB * 1024 * 1024:
+        raise ValueError(f"Files larger than {SORT_DOC_BATCH_MAX_MB} MB in total (uncompressed) cannot be sorted at once")
+
+
+def _remove_saved(folder, saved_filenames):
+    for saved_filename in saved_filenames:
+        try:
+            os.remove(os.path.join(folder, saved_filename))
+        except OSError:
+            pass
+
+
+def _zip_members(file, zip_name):
+    """Open an uploaded .zip; returns (archive, its .docx/.txt members)."""
+    try:
+        archive = zipfile.ZipFile(getattr(file, "stream", file))
+    except zipfile.BadZipFile:
+        raise ValueError(f"Invalid .zip file: {zip_name!r}")
+
+    members = [
+        info for info in archive.infolist()
+        if not info.is_dir()
+        and allowed_file(info.filename)
+        and not os.path.basename(info.filename).startswith(".")
+        and not info.filename.startswith("__MACOSX/")
+    ]
+    encrypted = [info.filename for info in members if info.flag_bits & 0x1]
+    if encrypted:
+        archive.close()
+        raise ValueError(f"{zip_name!r} has encrypted files, which cannot be read: {encrypted[0]!r}")
+    return archive, members
+
+
+def _save_zip_member(archive, info, zip_name, folder):
+    """Extract one .zip member under a short safe name; returns (name, saved_filename)."""
+    raw_name, ext = os.path.splitext(os.path.basename(info.filename))
+    saved_filename = f"{(secure_filename(raw_name) or 'file')[:10]}_{uuid.uuid4().hex}{ext.lower()}"
+    try:
+        with archive.open(info) as src, open(os.path.join(folder, saved_filename), "wb") as dst:
+            while chunk := src.read(1024 * 1024):
+                dst.write(chunk)
+    except (RuntimeError, NotImplementedError, zipfile.BadZipFile, zlib.error) as e:
+        # encrypted, unsupported compression or corrupt data
+        _remove_saved(folder, [saved_filename])
+        raise ValueError(f"Cannot read {info.filename!r} in {zip_name!r}: {e}")
+    return f"{zip_name}/{info.filename}", saved_filename
+
+
+def _save_batch(uploads, folder):
+    """
+    Save the files of a batch (members of a .zip extracted); returns
+    [(name, saved_filename)]. The file count and total uncompressed size
+    are limited for the whole batch. If anything fails, the files saved
+    so far are removed again.
+    """
+    sources = []
+    total_bytes = 0
+    try:
+        for file, filename in uploads:
+            if filename.lower().endswith(".zip"):
+                archive, members = _zip_members(file, filename)
+                with archive:
+                    total_bytes += sum(info.file_size for info in members)
+                    _check_batch_limits(len(sources) + len(members), total_bytes)
+                    for info in members:
+                        sources.append(_save_zip_member(archive, info, filename, folder))
+            elif allowed_file(filename):
+                total_bytes += _upload_size(file)
+                _check_batch_limits(len(sources) + 1, total_bytes)
+                sources.append((filename, save_upload(file, filename, folder)[1]))
+            else:
+                raise ValueError(f"Only .docx, .txt and .zip files are allowed: {filename!r}")
+    except Exception:
+        _remove_saved(folder, [saved_filename for _, saved_filename in sources])
+        raise
+    return sources
+
+
+def process_uploaded_batch(uploads):
+    """
+    Sort the words of several files at once: uploads is a list of
+    (file, filename) with .docx, .txt or .zip files. Each file is parsed
+    and its aksharas counted in the process pool; the unique words of all
+    files are merged into one lowest/highest pair of CSVs, and per-file
+    stats are returned alongside. A file that fails is reported with its
+    error and left out of the merge.
+    """
+    cleanup_old_folders()
+
+    today_folder = get_today_folder()
+    today_str = os.path.basename(today_folder)
+
+    sources = _save_batch(uploads, today_folder)
+    if not sources:
+        raise ValueError("No .docx or .txt files found")
+
+    pool = _get_pool()
+    futures = [
+        pool.submit(extract_and_count_file, os.path.abspath(os.path.join(today_folder, saved_filename)))
+        for _, saved_filename in sources
+    ]
+
+    # word -> akshara count, in order of first appearance
+    merged = {}
+    total_count = 0
+    files = []
+    for (name, saved_filename), future in zip(sources, futures):
+        try:
+            words, akshara_counts, file_total = future.result()
+        except BrokenProcessPool as e:
+            _reset_pool()
+            logger.error(f"Sort-doc worker pool broke while parsing {name!r}: {e}")
+            files.append({"file": name, "error": "worker process failed"})
+            continue
+        except Exception as e:
+            logger.warning(f"Failed to parse {name!r}: {e}")
+            files.append({"file": name, "error": str(e)})
+            continue
+
+        for word, count in zip(words, akshara_counts):
+            merged.setdefault(word, count)
+        total_count += file_total
+        files.append({
+            "file": name,
+            "original_file": f"/api/v1/sort-doc/download/{today_str}/{saved_filename}",
+            "total_word_count": file_total,
+            "unique_word_count": len(words),
+            "min_word_length": min(akshara_counts, default=0),
+            "max_word_length": max(akshara_counts, default=0),
+        })
+
+    lowest, highest, min_len, max_len = sort_lowest_highest_words(list(merged), list(merged.values()))
+
+    lowest_file, lowest_path = create_csv(lowest, "batch_lowest", folder=today_folder)
+    highest_file, highest_path = create_csv(highest, "batch_highest", folder=today_folder)
+    logger.info(f"Batch of {len(sources)} files sorted: {lowest_path}, {highest_path}")
+
+    return {
+        "files": files,
+        "file_count": len(sources),
+        "failed_count": sum(1 for f in files if "error" in f),
+        "total_word_count": total_count,
+        "unique_word_count": len(merged),
+        "min_word_length": min_len,
+        "max_word_length": max_len,
+        "download_lowest_url": f"/api/v1/sort-doc/download/{today_str}/{lowest_file}",
+        "download_highest_url": f"/api/v1/sort-doc/download/{today_str}/{highest_file}",
+    }
@@ -0,0 +1,131 @@
+import os
+import time
+from threading import Lock, Thread
+
+from app.utils.autocomplete_index import AutocompleteIndex
+from app.utils.logger import setup_logger
+from app.utils.utils import normalize_word, MainDictionaryBloom
+
+logger = setup_logger(name="AutocompleteService")
+
+# Completions precomputed per common prefix / max words ranked per query
+AUTOCOMPLETE_TOP_K = int(os.getenv("AUTOCOMPLETE_TOP_K", "20"))
+AUTOCOMPLETE_SCAN_LIMIT = int(os.getenv("AUTOCOMPLETE_SCAN_LIMIT", "1000"))
+
+DEFAULT_COMPLETIONS = 10
+
+
+class AutocompleteService:
+    """
+    Prefix autocomplete over the main dictionary, ranked by frequency.
+
+    Served from MainDictionaryBloom's mapped snapshot, so it needs no DB
+    query. Frequencies are the ones saved at the last rebuild; words
+    added since then are merged in from the overlay (after the ranked
+    ones) and removed words are filtered out. The index is rebuilt in the
+    background when the dictionary switches generation.
+    """
+    _index: AutocompleteIndex | None = None
+    _lock = Lock()
+    _build_thread: Thread | None = None
+    _last_build_ms: float | None = None
+    _builds: int = 0
+
+    # -------------------------------------------------
+    # LOAD / BUILD
+    # -------------------------------------------------
+    @classmethod
+    def warm_start(cls):
+        cls._load()
+
+    @classmethod
+    def _load(cls):
+        snapshot, generation, _ = MainDictionaryBloom.current_view()
+        if snapshot is None:
+            return
+
+        with cls._lock:
+            if cls._index is not None and cls._index.snapshot is snapshot:
+                return
+
+            started = time.perf_counter()
+            index = AutocompleteIndex.build(snapshot, AUTOCOMPLETE_TOP_K, AUTOCOMPLETE_SCAN_LIMIT)
+            cls._last_build_ms = round((time.perf_counter() - started) * 1000, 1)
+            cls._builds += 1
+            cls._index = index
+
+        logger.info(
+            f"Autocomplete index built for generation {generation} "
+            f"({len(snapshot)} words) in {cls._last_build_ms} ms"
+        )
+
+    @classmethod
+    def _reload_in_background(cls):
+        thread = cls._build_thread
+        if thread is not None and thread.is_alive():
+            return
+
+        def reload():
+            try:
+                cls._load()
+            except Exception as e:
+                logger.exception(f"Autocomplete index reload failed: {e}")
+
+        cls._build_thread = Thread(target=reload, name="autocomplete-index", daemon=True)
+        cls._build_thread.start()
+
+    # -------------------------------------------------
+    # COMPLETE
+    # -------------------------------------------------
+    @classmethod
+    def is_ready(cls) -> bool:
+        return cls._index is not None
+
+    @classmethod
+    def complete(cls, prefix: str, limit: int = DEFAULT_COMPLETIONS) -> dict:
+        prefix = normalize_word(prefix)
+        limit = max(1, min(limit, AUTOCOMPLETE_TOP_K))
+
+        snapshot, _, added = MainDictionaryBloom.current_view()
+        index = cls._index
+        if index.snapshot is not snapshot:
+            cls._reload_in_background()
+
+        # Fetch the full top-k so removed words can be dropped
+        completions = [
+            {"word": word, "frequency": frequency}
+            for word, frequency in index.complete(prefix, AUTOCOMPLETE_TOP_K)
+            if MainDictionaryBloom.contains(word)
+        ]
+
+        if len(completions) < limit:
+            seen = {item["word"] for item in completions}
+            completions.extend(
+                {"word": word, "frequency": 0}
+                for word in sorted(w for w in added if w.startswith(prefix) and w not in seen)
+            )
+
+        return {
+            "prefix": prefix,
+            "completions": completions[:limit]
+        }
+
+    # -------------------------------------------------
+    # STATS
+    # -------------------------------------------------
+    @classmethod
+    def stats(cls) -> dict:
+        index = cls._index
+        if index is None:
+            return {"loaded": False}
+
+        return {
+            "loaded": True,
+            "indexed_words": len(index.snapshot),
+            "top_k": index.top_k,
+            "scan_limit": index.scan_limit,
+            "precomputed_prefixes": index.precomputed_prefixes(),
+            "index_memory_mb": round(index.memory_bytes() / 1024 / 1024, 2),
+            "builds": cls._builds,
+            "last_build_ms": cls._last_build_ms,
+        }
@@ -0,0 +1,54 @@
+from app.services.spellcheck.main_dictionary_service import MainDictionaryService
+from app.services.spellcheck.user_dictionary_service import UserDictionaryService
+from app.utils.logger import setup_logger
+from app.utils.utils import normalize_word, MainDictionaryBloom, UserDictionaryBloom
+
+logger = setup_logger(name="DictionaryLookupService")
+
+VERIFIED = "verified"
+PENDING = "pending"
+UNKNOWN = "unknown"
+
+
+class DictionaryLookupService:
+
+    # -------------------------------------------------
+    # THREE-STATE LOOKUP (verified / pending / unknown)
+    # -------------------------------------------------
+    @staticmethod
+    def lookup(words) -> dict:
+        """
+        Classify words as verified (main dictionary), pending (user
+        dictionary) or unknown. Each table is answered from its in-memory
+        filter, with at most one chunked IN (...) query for the words the
+        filter cannot answer yet.
+        """
+        if isinstance(words, str):
+            words = [words]
+
+        unique_words = list(dict.fromkeys(
+            word for word in (normalize_word(w) for w in words) if word
+        ))
+
+        verified = MainDictionaryBloom.resolve(unique_words, MainDictionaryService.existing_words)
+        pending = UserDictionaryBloom.resolve(
+            [w for w in unique_words if w not in verified],
+            UserDictionaryService.existing_words
+        )
+
+        results = []
+        counts = {VERIFIED: 0, PENDING: 0, UNKNOWN: 0}
+        for word in unique_words:
+            if word in verified:
+                state = VERIFIED
+            elif word in pending:
+                state = PENDING
+            else:
+                state = UNKNOWN
+            counts[state] += 1
+            results.append({"word": word, "state": state})
+
+        return {
+            "results": results,
+            "counts": counts
+        }
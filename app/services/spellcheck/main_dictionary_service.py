@@ -1,47 +1,94 @@
-from sqlalchemy.exc import IntegrityError
+import os
+
+from sqlalchemy import case
 from app.config.database import kagapa_tools_db as db
 from app.models.spellcheck import MainDictionary
+from app.utils.bulk_sql import chunked, delete_words, insert_new_rows
+from app.utils.frequency_buffer import FrequencyBuffer
 from app.utils.logger import setup_logger
-from app.utils.utils import normalize_word, MainDictionaryBloom
+from app.utils.lookup_cache import DictionaryEntry, LookupCache
+from app.utils.utils import normalize_word, tokenize_with_positions, MainDictionaryBloom
 
 logger = setup_logger(name="MainDictionaryService")
 
+# Max number of bind parameters per IN (...) query / rows per bulk INSERT
+LOOKUP_CHUNK_SIZE = 1000
+
+# Max number of words per batch check / lookup request
+BATCH_MAX_WORDS = int(os.getenv("BATCH_MAX_WORDS", "10000"))
+
+# Longer words would be truncated by INSERT IGNORE instead of rejected
+WORD_MAX_LENGTH = MainDictionary.word.type.length
+
+# Read-through cache for get_word (shared sizing with the user dictionary cache)
+WORD_CACHE_SIZE = int(os.getenv("WORD_CACHE_SIZE", "20000"))
+WORD_CACHE_TTL_SECONDS = float(os.getenv("WORD_CACHE_TTL_SECONDS", "60"))
+
+main_word_cache = LookupCache("main_dictionary", WORD_CACHE_SIZE, WORD_CACHE_TTL_SECONDS)
+
 
 class MainDictionaryService:
 
     # -------------------------------------------------
-    # CREATE (DB ONLY)
+    # CREATE (DB + in-memory filter)
     # -------------------------------------------------
     @staticmethod
     def create(words, added_by: str | None = None) -> dict:
+        """
+        Insert words in one transaction, one INSERT IGNORE (or ON CONFLICT
+        DO NOTHING) per chunk, and report exactly which were created,
+        which were skipped as duplicates (of the table or of the input) and
+        which were invalid (empty or longer than WORD_MAX_LENGTH).
+        """
         if isinstance(words, str):
             words = [words]
 
+        words = [normalize_word(raw_word) for raw_word in words]
+        invalid = [word for word in words if not word or len(word) > WORD_MAX_LENGTH]
+        words = [word for word in words if word and len(word) <= WORD_MAX_LENGTH]
+        unique_words = list(dict.fromkeys(words))
+
+        created = set()
+        try:
+            for chunk in chunked(unique_words, LOOKUP_CHUNK_SIZE):
+                existing = MainDictionaryService.existing_words(chunk)
+                rows = [
+                    {"word": word, "added_by": added_by, "verified": True}
+                    for word in chunk
+                    if word not in existing
+                ]
+                created |= insert_new_rows(MainDictionary, rows)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
         result = {
             "created": [],
-            "skipped": []
+            "skipped": [],
+            "invalid": invalid
         }
-
-        for raw_word in words:
-            word = normalize_word(raw_word)
-
-            entry = MainDictionary(
-                word=word,
-                added_by=added_by,
-                verified=True
-            )
-
-            try:
-                db.session.add(entry)
-                db.session.commit()
-                logger.info(f"Main dictionary word added: {word}")
+        for word in words:
+            if word in created:
                 result["created"].append(word)
-
-            except IntegrityError:
-                db.session.rollback()
-                logger.warning(f"Duplicate main dictionary word: {word}")
+                created.discard(word)
+            else:
                 result["skipped"].append(word)
 
+        logger.info(
+            f"Main dictionary words added: {len(result['created'])} created, "
+            f"{len(result['skipped'])} skipped, "
+            f"{len(result['invalid'])} invalid"
+        )
+        if result["skipped"]:
+            logger.warning(f"Duplicate main dictionary words skipped: {result['skipped'][:20]}")
+        if result["invalid"]:
+            logger.warning(
+                f"Empty or over-length main dictionary words rejected: {result['invalid'][:20]}"
+            )
+
+        main_word_cache.invalidate(result["created"])
+        MainDictionaryBloom.add_words(result["created"])
         return result
 
     # -------------------------------------------------
@@ -51,13 +98,99 @@ class MainDictionaryService:
     def exists_fast(word: str) -> bool:
         if not MainDictionaryBloom.might_exist(word):
             return False
-        return MainDictionaryService.get_word(word) is not None
+        exists = MainDictionaryBloom.contains(word)
+        if exists is None:
+            exists = MainDictionaryService.get_word(word) is not None
+
+        MainDictionaryBloom.record_positives(1, 0 if exists else 1)
+        return exists
+
+    # -------------------------------------------------
+    # BATCH CHECK (text OR word list)
+    # -------------------------------------------------
+    @staticmethod
+    def existing_words(words) -> set[str]:
+        """
+        Return the subset of (already normalized) words present in the
+        main dictionary, using one IN (...) query per chunk.
+        """
+        words = list(words)
+        found = set()
+
+        for i in range(0, len(words), LOOKUP_CHUNK_SIZE):
+            chunk = words[i:i + LOOKUP_CHUNK_SIZE]
+            rows = (
+                db.session.query(MainDictionary.word)
+                .filter(MainDictionary.word.in_(chunk))
+                .all()
+            )
+            found.update(word for (word,) in rows)
+
+        return found
+
+    @staticmethod
+    def check_batch(text: str | None = None, words=None) -> dict:
+        """
+        Spellcheck a whole text or a list of words in one call.
+
+        Text is tokenized and normalized once, bloom negatives are dropped
+        in memory and the remaining candidates are answered from the exact
+        snapshot, or confirmed with chunked IN (...) queries if it is not
+        loaded yet. Unknown words are returned with their positions:
+        character offsets for text, list indexes for word lists.
+        """
+        positions: dict[str, list[dict]] = {}
+        total_tokens = 0
+
+        if text is not None:
+            for word, start, end in tokenize_with_positions(text):
+                positions.setdefault(word, []).append({"start": start, "end": end})
+                total_tokens += 1
+        else:
+            if isinstance(words, str):
+                words = [words]
+            for index, raw_word in enumerate(words or []):
+                word = normalize_word(raw_word)
+                if not word:
+                    continue
+                positions.setdefault(word, []).append({"index": index})
+                total_tokens += 1
+
+        known = MainDictionaryBloom.resolve(positions, MainDictionaryService.existing_words)
+
+        unknown = [
+            {"word": word, "positions": word_positions}
+            for word, word_positions in positions.items()
+            if word not in known
+        ]
+
+        return {
+            "total_tokens": total_tokens,
+            "unique_words": len(positions),
+            "unknown_count": len(unknown),
+            "unknown": unknown
+        }
 
     # -------------------------------------------------
     # READ
     # -------------------------------------------------
     @staticmethod
-    def get_word(word: str) -> MainDictionary | None:
+    def get_word(word: str) -> DictionaryEntry | None:
+        """Cached, read-only lookup (positive and negative results)."""
+        word = normalize_word(word)
+
+        hit, entry, epoch = main_word_cache.get(word)
+        if hit:
+            return entry
+
+        row = MainDictionaryService._query_entry(word)
+        entry = DictionaryEntry.from_row(row) if row else None
+        main_word_cache.put(word, entry, epoch)
+        return entry
+
+    @staticmethod
+    def _query_entry(word: str) -> MainDictionary | None:
+        """Uncached ORM row, for write paths."""
         return MainDictionary.query.filter_by(
             word=normalize_word(word)
         ).first()
@@ -98,38 +231,93 @@ class MainDictionaryService:
     # -------------------------------------------------
     @staticmethod
     def increment_frequency(word: str) -> bool:
-        entry = MainDictionaryService.get_word(word)
-        if not entry:
+        """
+        Count one use of word. Increments are buffered and written in
+        batches by main_frequency_buffer (started in run.py); without a
+        running buffer the increment is applied right away.
+        """
+        word = normalize_word(word)
+        if not word or not MainDictionaryService.exists_fast(word):
             return False
 
-        entry.frequency += 1
-        db.session.commit()
+        MainDictionaryService.add_frequencies({word: 1})
         return True
 
+    @staticmethod
+    def add_frequencies(counts: dict[str, int]):
+        """
+        Add counts to the frequencies of existing words, through the
+        write-behind buffer when it is running.
+        """
+        unbuffered = {
+            word: count
+            for word, count in counts.items()
+            if not main_frequency_buffer.add(word, count)
+        }
+        if unbuffered:
+            MainDictionaryService.apply_frequency_increments(unbuffered)
+
+    @staticmethod
+    def apply_frequency_increments(counts: dict[str, int]):
+        """
+        Add counts to the stored frequencies in one transaction, using
+        UPDATE ... SET frequency = frequency + CASE word ... END per chunk.
+        Done in SQL, so concurrent increments from other workers are not lost.
+        """
+        items = list(counts.items())
+
+        for i in range(0, len(items), LOOKUP_CHUNK_SIZE):
+            chunk = dict(items[i:i + LOOKUP_CHUNK_SIZE])
+            (
+                db.session.query(MainDictionary)
+                .filter(MainDictionary.word.in_(chunk))
+                .update(
+                    {MainDictionary.frequency: MainDictionary.frequency + case(chunk, value=MainDictionary.word, else_=0)},
+                    synchronize_session=False
+                )
+            )
+
+        db.session.commit()
+        main_word_cache.invalidate(counts)
+
     # -------------------------------------------------
-    # DELETE (DB ONLY)
+    # DELETE (DB + in-memory filter)
     # -------------------------------------------------
     @staticmethod
     def delete(words) -> dict:
+        """
+        Delete words in one transaction with chunked
+        DELETE ... WHERE word IN (...) statements.
+        """
         if isinstance(words, str):
             words = [words]
 
+        words = list(dict.fromkeys(
+            word for word in (normalize_word(raw_word) for raw_word in words) if word
+        ))
+
+        try:
+            removed, matched = delete_words(MainDictionary, words, LOOKUP_CHUNK_SIZE)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
         result = {
-            "deleted": [],
-            "not_found": []
+            "deleted": [word for word in words if word in matched],
+            "not_found": [word for word in words if word not in matched]
         }
+        logger.info(f"Main dictionary words deleted: {len(removed)}")
 
-        for raw_word in words:
-            word = normalize_word(raw_word)
-            entry = MainDictionaryService.get_word(word)
-
-            if not entry:
-                result["not_found"].append(word)
-                continue
+        main_word_cache.invalidate(result["deleted"] + removed)
+        MainDictionaryBloom.remove_words(removed)
+        return result
 
-            db.session.delete(entry)
-            db.session.commit()
-            logger.info(f"Main dictionary word deleted: {word}")
-            result["deleted"].append(word)
 
-        return result
+# Write-behind buffer for increment_frequency (see FrequencyBuffer)
+main_frequency_buffer = FrequencyBuffer(
+    "main_dictionary",
+    MainDictionaryService.apply_frequency_increments,
+    max_keys=int(os.getenv("FREQUENCY_BUFFER_MAX_WORDS", "5000")),
+    interval_seconds=float(os.getenv("FREQUENCY_FLUSH_INTERVAL_SECONDS", "5"))
+)
@@ -0,0 +1,235 @@
+import os
+import time
+from threading import Lock, Thread
+
+from app.utils.dictionary_persistence import (
+    file_lock,
+    lock_path,
+    remove_stale_suggestion_indexes,
+    suggestion_index_path,
+)
+from app.utils.logger import setup_logger
+from app.utils.suggestion_index import CODEPOINT, METRICS, SuggestionIndex, edit_distance, word_units
+from app.utils.utils import normalize_word, MainDictionaryBloom
+
+logger = setup_logger(name="SuggestionService")
+
+# Deletion index settings (changing them rebuilds the shared index)
+SUGGEST_MAX_EDIT_DISTANCE = int(os.getenv("SUGGEST_MAX_EDIT_DISTANCE", "2"))
+SUGGEST_PREFIX_LENGTH = int(os.getenv("SUGGEST_PREFIX_LENGTH", "7"))
+
+# Akshara distance is opt-in: every candidate is segmented and compared
+# in Python, about 25 ms per query on 100k words against about 1 ms in
+# code points (python -m benchmarks.suggestion_benchmark). Only the
+# default metric's index is built at warm-up; the others on first use.
+DEFAULT_METRIC = CODEPOINT
+DEFAULT_SUGGESTIONS = 5
+MAX_SUGGESTIONS = 50
+
+
+class SuggestionService:
+    """
+    Spelling suggestions for a word from the main dictionary, ranked by
+    edit distance and then by frequency. Distance is counted in code
+    points by default, or in aksharas (one vowel sign or conjunct change
+    is one edit) with metric="akshara".
+
+    One deletion index per metric is derived from MainDictionaryBloom's
+    snapshot and saved next to it per generation, so one worker builds it
+    and the others map it. The default metric's index is loaded at
+    warm-up; another metric's is built in the background on its first
+    request. Words added since the snapshot are compared directly;
+    removed words are filtered through the dictionary filter. When the
+    dictionary switches generation an index is rebuilt in the background
+    on its next request and the previous one keeps answering meanwhile.
+    """
+    _indexes: dict[str, SuggestionIndex] = {}
+    _lock = Lock()
+    _build_threads: dict[str, Thread] = {}
+    _loaded_from: dict[str, str] = {}
+    _last_build_ms: dict[str, float] = {}
+    _builds: int = 0
+
+    # -------------------------------------------------
+    # LOAD / BUILD
+    # -------------------------------------------------
+    @classmethod
+    def warm_start(cls):
+        cls._load(DEFAULT_METRIC)
+
+    @classmethod
+    def _load(cls, metric: str):
+        snapshot, generation, _ = MainDictionaryBloom.current_view()
+        if snapshot is None:
+            return
+
+        with cls._lock:
+            index = cls._indexes.get(metric)
+            if index is not None and index.snapshot is snapshot:
+                return
+
+            name = MainDictionaryBloom.SNAPSHOT_NAME
+            index = None
+            loaded_from = "memory"
+            try:
+                with file_lock(lock_path(name, "suggest")):
+                    path = suggestion_index_path(name, generation, metric)
+                    index = SuggestionIndex.load(
+                        path, snapshot, generation, metric, SUGGEST_MAX_EDIT_DISTANCE, SUGGEST_PREFIX_LENGTH
+                    )
+                    if index is None:
+                        index = cls._build(snapshot, generation, metric)
+                        index.save(path)
+                    remove_stale_suggestion_indexes(name, generation)
+                    loaded_from = "shared file"
+            except OSError as e:
+                logger.warning(f"Could not share the {metric} suggestion index for {name}: {e}")
+                if index is None:
+                    index = cls._build(snapshot, generation, metric)
+
+            cls._indexes = {**cls._indexes, metric: index}
+            cls._loaded_from[metric] = loaded_from
+
+        logger.info(
+            f"Suggestion index ({metric}) ready ({len(snapshot)} words, generation {generation}, {loaded_from})"
+        )
+
+    @classmethod
+    def _build(cls, snapshot, generation, metric: str) -> SuggestionIndex:
+        started = time.perf_counter()
+        index = SuggestionIndex.build(
+            snapshot, generation, metric, SUGGEST_MAX_EDIT_DISTANCE, SUGGEST_PREFIX_LENGTH
+        )
+        cls._last_build_ms[metric] = round((time.perf_counter() - started) * 1000, 1)
+        cls._builds += 1
+        logger.info(f"Suggestion index ({metric}) built: {len(index.keys)} keys in {cls._last_build_ms[metric]} ms")
+        return index
+
+    @classmethod
+    def _load_in_background(cls, metric: str):
+        thread = cls._build_threads.get(metric)
+        if thread is not None and thread.is_alive():
+            return
+
+        def load():
+            try:
+                cls._load(metric)
+            except Exception as e:
+                logger.exception(f"Suggestion index ({metric}) load failed: {e}")
+
+        thread = Thread(target=load, name=f"suggestion-index-{metric}", daemon=True)
+        cls._build_threads[metric] = thread
+        thread.start()
+
+    # -------------------------------------------------
+    # SUGGEST
+    # -------------------------------------------------
+    @staticmethod
+    def check_metric(metric: str):
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of: {', '.join(METRICS)}")
+
+    @classmethod
+    def is_ready(cls, metric: str = DEFAULT_METRIC) -> bool:
+        """
+        Whether metric's index is loaded. If it is not, and the dictionary
+        snapshot is, the index is built in the background.
+        """
+        cls.check_metric(metric)
+        if metric in cls._indexes:
+            return True
+        snapshot, _, _ = MainDictionaryBloom.current_view()
+        if snapshot is not None:
+            cls._load_in_background(metric)
+        return False
+
+    @classmethod
+    def suggest(
+        cls,
+        word: str,
+        limit: int = DEFAULT_SUGGESTIONS,
+        max_distance: int | None = None,
+        metric: str = DEFAULT_METRIC
+    ) -> dict:
+        """
+        Return known dictionary words within max_distance edits of word.
+        The word itself is not listed; `known` says whether it exists.
+        """
+        cls.check_metric(metric)
+
+        word = normalize_word(word)
+        limit = max(1, min(limit, MAX_SUGGESTIONS))
+        if max_distance is None:
+            max_distance = SUGGEST_MAX_EDIT_DISTANCE
+        max_distance = max(0, min(max_distance, SUGGEST_MAX_EDIT_DISTANCE))
+
+        snapshot, _, added = MainDictionaryBloom.current_view()
+        index = cls._indexes.get(metric)
+        if index is not None and index.snapshot is not snapshot:
+            cls._load_in_background(metric)
+
+        units = word_units(word, metric)
+
+        # word -> (distance, frequency)
+        found = {}
+        if index is not None:
+            for position in index.candidates(word, max_distance):
+                candidate = index.snapshot.word_at(position)
+                distance = edit_distance(units, word_units(candidate, metric), max_distance)
+                if 0 < distance <= max_distance:
+                    found[candidate] = (distance, index.snapshot.frequency_at(position))
+
+            # The index may lag behind a rebuild; drop words removed since
+            for candidate in [c for c in found if not MainDictionaryBloom.contains(c)]:
+                del found[candidate]
+
+        # Words added after the snapshot (frequency not tracked yet)
+        for candidate in added:
+            if candidate not in found:
+                distance = edit_distance(units, word_units(candidate, metric), max_distance)
+                if 0 < distance <= max_distance:
+                    found[candidate] = (distance, 0)
+
+        ranked = sorted(found.items(), key=lambda item: (item[1][0], -item[1][1], item[0]))
+
+        return {
+            "word": word,
+            "known": bool(MainDictionaryBloom.contains(word)),
+            "metric": metric,
+            "max_distance": max_distance,
+            "suggestions": [
+                {"word": candidate, "distance": distance, "frequency": frequency}
+                for candidate, (distance, frequency) in ranked[:limit]
+            ]
+        }
+
+    # -------------------------------------------------
+    # STATS
+    # -------------------------------------------------
+    @classmethod
+    def stats(cls) -> dict:
+        indexes = cls._indexes
+        default_index = indexes.get(DEFAULT_METRIC)
+        if default_index is None:
+            return {"loaded": False}
+
+        return {
+            "loaded": True,
+            "default_metric": DEFAULT_METRIC,
+            "indexed_words": len(default_index.snapshot),
+            "max_edit_distance": default_index.max_distance,
+            "prefix_length": default_index.prefix_length,
+            "generation": default_index.generation,
+            "loaded_from": cls._loaded_from.get(DEFAULT_METRIC),
+            "builds": cls._builds,
+            "metrics": {
+                metric: {
+                    "generation": index.generation,
+                    "keys": len(index.keys),
+                    "index_memory_mb": round(index.memory_bytes() / 1024 / 1024, 2),
+                    "loaded_from": cls._loaded_from.get(metric),
+                    "last_build_ms": cls._last_build_ms.get(metric),
+                }
+                for metric, index in indexes.items()
+            },
+        }
@@ -1,38 +1,65 @@
-import io
-import re
 from collections import Counter
 
-from docx import Document  # python-docx
-from sqlalchemy import select, collate
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import collate, delete, insert, literal, or_, select, true
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.config.database import kagapa_tools_db as db
-from app.models.spellcheck import UserAddedWord
-from app.services.spellcheck.main_dictionary_service import MainDictionaryService
+from app.models.spellcheck import MainDictionary, UserAddedWord, ist_now
+from app.services.spellcheck.main_dictionary_service import (
+    MainDictionaryService,
+    LOOKUP_CHUNK_SIZE,
+    WORD_CACHE_SIZE,
+    WORD_CACHE_TTL_SECONDS,
+    WORD_MAX_LENGTH,
+    main_word_cache,
+)
+from app.utils.bulk_sql import chunked, delete_words, upsert_increment
 from app.utils.logger import setup_logger
-from app.utils.utils import normalize_word
+from app.utils.lookup_cache import DictionaryEntry, LookupCache
+from app.utils.tokenizer import count_file_words
+from app.utils.utils import normalize_word, MainDictionaryBloom, UserDictionaryBloom
 
 logger = setup_logger(name="UserDictionaryService")
 
+user_word_cache = LookupCache("user_dictionary", WORD_CACHE_SIZE, WORD_CACHE_TTL_SECONDS)
+
 
 class UserDictionaryService:
     # -------------------------------------------------
     # ADD (single OR bulk)
     # -------------------------------------------------
     @staticmethod
-    def add(words, added_by: str | None = None) -> dict:
-        """Add user words with atomic updates and frequency tracking."""
+    def add(words, added_by: str | None = None, bump_main_frequency: bool = False) -> dict:
+        """
+        Add user words with atomic updates and frequency tracking.
+
+        Words already in the main dictionary are not added; they are listed
+        under in_main_dictionary and, with bump_main_frequency, counted
+        there instead.
+        """
         if isinstance(words, str):
             words = [words]
 
-        result = {"added": {}, "updated": {}, "skipped": []}
+        result = {"added": {}, "updated": {}, "skipped": [], "in_main_dictionary": []}
+
+        normalized = [(raw_word, normalize_word(raw_word)) for raw_word in words]
+        known = MainDictionaryBloom.resolve(
+            list(dict.fromkeys(word for _, word in normalized if word)),
+            MainDictionaryService.existing_words
+        )
+        known_counts = Counter()
 
-        for raw_word in words:
-            word = normalize_word(raw_word)
+        for raw_word, word in normalized:
             if not word:
                 result["skipped"].append(raw_word)
                 continue
 
+            if word in known:
+                if word not in known_counts:
+                    result["in_main_dictionary"].append(word)
+                known_counts[word] += 1
+                continue
+
             # ✅ Use explicit collation to avoid mix errors
             existing = (
                 db.session.execute(
@@ -90,24 +117,87 @@ class UserDictionaryService:
                     result["skipped"].append(word)
                     logger.warning(f"[UserDictionaryService] Failed to add/update: {word}")
 
+        user_word_cache.invalidate(list(result["added"]) + list(result["updated"]))
+        UserDictionaryBloom.add_words(result["added"])
+
+        result["main_frequency_bumped"] = bool(bump_main_frequency and known_counts)
+        if result["main_frequency_bumped"]:
+            MainDictionaryService.add_frequencies(known_counts)
         return result
 
     # -------------------------------------------------
     # READ
     # -------------------------------------------------
     @staticmethod
-    def get_word(word: str) -> UserAddedWord | None:
+    def get_word(word: str) -> DictionaryEntry | None:
+        """Cached, read-only lookup (positive and negative results)."""
+        word = normalize_word(word)
+
+        hit, entry, epoch = user_word_cache.get(word)
+        if hit:
+            return entry
+
+        row = UserDictionaryService._query_entry(word)
+        entry = DictionaryEntry.from_row(row) if row else None
+        user_word_cache.put(word, entry, epoch)
+        return entry
+
+    @staticmethod
+    def _query_entry(word: str) -> UserAddedWord | None:
+        """Uncached ORM row, for write paths."""
         return (
             UserAddedWord.query
             .filter(collate(UserAddedWord.word, "utf8mb4_unicode_ci") == normalize_word(word))
             .first()
         )
 
+    @staticmethod
+    def existing_words(words) -> set[str]:
+        """
+        Return the subset of (already normalized) words present in
+        user_added_words, using one IN (...) query per chunk.
+        """
+        words = list(words)
+        found = set()
+
+        for i in range(0, len(words), LOOKUP_CHUNK_SIZE):
+            chunk = words[i:i + LOOKUP_CHUNK_SIZE]
+            rows = (
+                db.session.query(UserAddedWord.word)
+                .filter(collate(UserAddedWord.word, "utf8mb4_unicode_ci").in_(chunk))
+                .all()
+            )
+            found.update(word for (word,) in rows)
+
+        return found
+
+    @staticmethod
+    def pending_query(search: str | None = None, min_frequency: int | None = None, added_by: str | None = None):
+        """
+        Query for pending (unverified) words. search matches word or
+        added_by; min_frequency and added_by (exact) narrow it further.
+        """
+        query = UserAddedWord.query.filter_by(verified=False)
+
+        if search:
+            like_term = f"%{search}%"
+            query = query.filter(
+                or_(
+                    UserAddedWord.word.ilike(like_term),
+                    UserAddedWord.added_by.ilike(like_term),
+                )
+            )
+        if min_frequency is not None:
+            query = query.filter(UserAddedWord.frequency >= min_frequency)
+        if added_by:
+            query = query.filter(UserAddedWord.added_by == added_by)
+
+        return query
+
     @staticmethod
     def list_pending(limit: int = 100, offset: int = 0):
         return (
-            UserAddedWord.query
-            .filter_by(verified=False)
+            UserDictionaryService.pending_query()
             .order_by(UserAddedWord.created_at.asc())
             .offset(offset)
             .limit(limit)
@@ -119,23 +209,37 @@ class UserDictionaryService:
     # -------------------------------------------------
     @staticmethod
     def delete(words) -> dict:
+        """
+        Delete words in one transaction with chunked
+        DELETE ... WHERE word IN (...) statements.
+        """
         if isinstance(words, str):
             words = [words]
 
-        result = {"deleted": [], "not_found": []}
+        words = list(dict.fromkeys(
+            word for word in (normalize_word(raw_word) for raw_word in words) if word
+        ))
 
-        for raw_word in words:
-            word = normalize_word(raw_word)
-            entry = UserDictionaryService.get_word(word)
-            if not entry:
-                result["not_found"].append(word)
-                continue
-
-            db.session.delete(entry)
+        try:
+            removed, matched = delete_words(
+                UserAddedWord,
+                words,
+                LOOKUP_CHUNK_SIZE,
+                match_column=collate(UserAddedWord.word, "utf8mb4_unicode_ci")
+            )
             db.session.commit()
-            logger.info(f"User word deleted: {word}")
-            result["deleted"].append(word)
+        except Exception:
+            db.session.rollback()
+            raise
+
+        result = {
+            "deleted": [word for word in words if word in matched],
+            "not_found": [word for word in words if word not in matched]
+        }
+        logger.info(f"User words deleted: {len(removed)}")
 
+        user_word_cache.invalidate(result["deleted"] + removed)
+        UserDictionaryBloom.remove_words(removed)
         return result
 
     # -------------------------------------------------
@@ -143,42 +247,165 @@ class UserDictionaryService:
     # -------------------------------------------------
     @classmethod
     def approve_and_move_to_main(cls, words, admin_name: str | None = None) -> dict:
+        """
+        Move user words to the main dictionary (keeping their frequency) in
+        one transaction: per chunk, one INSERT ... SELECT into
+        main_dictionary and one DELETE from user_added_words. Words that
+        are already in the main dictionary are left where they are.
+        """
         if isinstance(words, str):
             words = [words]
 
-        result = {"moved": [], "already_exists": [], "not_found": [], "failed": []}
+        words = list(dict.fromkeys(
+            word for word in (normalize_word(raw_word) for raw_word in words) if word
+        ))
 
-        for raw_word in words:
-            word = normalize_word(raw_word)
-            user_entry = cls.get_word(word)
-            if not user_entry:
-                result["not_found"].append(word)
-                continue
+        moved, already_exists, failed = [], [], []
+        try:
+            for chunk in chunked(words, LOOKUP_CHUNK_SIZE):
+                stored = sorted(cls.existing_words(chunk))
+                try:
+                    chunk_moved, chunk_existing = cls._move_to_main(stored, admin_name)
+                except IntegrityError as e:
+                    logger.error(f"Failed to move {len(stored)} words to main dictionary: {e}")
+                    failed.extend(stored)
+                    continue
+                moved.extend(chunk_moved)
+                already_exists.extend(chunk_existing)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
 
-            try:
-                create_result = MainDictionaryService.create(
-                    word, added_by=admin_name or user_entry.added_by
-                )
+        # Report input words; the stored form may differ under the collation
+        status = {}
+        for key, stored_words in (("moved", moved), ("already_exists", already_exists), ("failed", failed)):
+            status.update((word.casefold(), key) for word in stored_words)
 
-                if word in create_result["skipped"]:
-                    result["already_exists"].append(word)
-                    continue
+        result = {"moved": [], "already_exists": [], "not_found": [], "failed": []}
+        for word in words:
+            result[status.get(word.casefold(), "not_found")].append(word)
 
-                main_entry = MainDictionaryService.get_word(word)
-                main_entry.frequency = user_entry.frequency
+        logger.info(
+            f"User words approved: {len(moved)} moved to main dictionary, "
+            f"{len(already_exists)} already there, {len(failed)} failed"
+        )
 
-                db.session.delete(user_entry)
-                db.session.commit()
-                logger.info(f"Word moved to main dictionary: {word}")
-                result["moved"].append(word)
+        main_word_cache.invalidate(result["moved"] + moved)
+        user_word_cache.invalidate(result["moved"] + moved)
+        MainDictionaryBloom.add_words(moved)
+        UserDictionaryBloom.remove_words(moved)
+        return result
+
+    @classmethod
+    def approve_pending(
+        cls,
+        search: str | None = None,
+        min_frequency: int | None = None,
+        added_by: str | None = None,
+        admin_name: str | None = None,
+        dry_run: bool = False
+    ) -> dict:
+        """
+        Move every pending word matching the pending_query criteria to the
+        main dictionary, one chunk of rows (in id order) per transaction.
+        With dry_run, only count the matching words.
+        """
+        if not search and min_frequency is None and not added_by:
+            raise ValueError("search, min_frequency or added_by is required")
+
+        query = cls.pending_query(search, min_frequency, added_by)
+        result = {"matched": query.count(), "dry_run": dry_run}
+        if dry_run:
+            result["already_exists"] = (
+                query
+                .join(MainDictionary, MainDictionary.word == UserAddedWord.word)
+                .count()
+            )
+            return result
+
+        moved = already_exists = failed = 0
+        last_id = 0
+        while True:
+            rows = (
+                query
+                .filter(UserAddedWord.id > last_id)
+                .order_by(UserAddedWord.id.asc())
+                .with_entities(UserAddedWord.id, UserAddedWord.word)
+                .limit(LOOKUP_CHUNK_SIZE)
+                .all()
+            )
+            if not rows:
+                break
+            last_id = rows[-1].id
+            stored = [row.word for row in rows]
 
-            except Exception as e:
+            try:
+                chunk_moved, chunk_existing = cls._move_to_main(stored, admin_name)
+                db.session.commit()
+            except IntegrityError as e:
                 db.session.rollback()
-                logger.error(f"Failed to move word '{word}': {e}")
-                result["failed"].append(word)
+                logger.error(f"Failed to move {len(stored)} words to main dictionary: {e}")
+                failed += len(stored)
+                continue
+            except Exception:
+                db.session.rollback()
+                raise
+
+            moved += len(chunk_moved)
+            already_exists += len(chunk_existing)
+            main_word_cache.invalidate(chunk_moved)
+            user_word_cache.invalidate(chunk_moved)
+            MainDictionaryBloom.add_words(chunk_moved)
+            UserDictionaryBloom.remove_words(chunk_moved)
 
+        logger.info(
+            f"Pending words approved by filter (search={search!r}, min_frequency={min_frequency}, "
+            f"added_by={added_by!r}): {moved} moved, {already_exists} already in main dictionary, "
+            f"{failed} failed"
+        )
+        result.update(moved=moved, already_exists=already_exists, failed=failed)
         return result
 
+    @staticmethod
+    def _move_to_main(stored: list[str], admin_name: str | None) -> tuple[list[str], list[str]]:
+        """
+        Move user rows, given by their stored word, to main_dictionary
+        inside a savepoint. Returns (moved, already in main dictionary).
+        A word inserted into main_dictionary concurrently raises
+        IntegrityError and the savepoint is rolled back.
+        """
+        in_main = {word.casefold() for word in MainDictionaryService.existing_words(stored)}
+        already_exists = [word for word in stored if word.casefold() in in_main]
+        to_move = [word for word in stored if word.casefold() not in in_main]
+        if not to_move:
+            return [], already_exists
+
+        now = ist_now()
+        source = (
+            select(
+                UserAddedWord.word,
+                UserAddedWord.frequency,
+                literal(admin_name, MainDictionary.added_by.type) if admin_name else UserAddedWord.added_by,
+                true(),
+                literal(now, MainDictionary.created_at.type),
+                literal(now, MainDictionary.updated_at.type),
+            )
+            .where(UserAddedWord.word.in_(to_move))
+        )
+
+        with db.session.begin_nested():
+            db.session.execute(
+                insert(MainDictionary.__table__).from_select(
+                    ["word", "frequency", "added_by", "verified", "created_at", "updated_at"],
+                    source
+                )
+            )
+            db.session.execute(
+                delete(UserAddedWord.__table__).where(UserAddedWord.word.in_(to_move))
+            )
+        return to_move, already_exists
+
 
 # ======================================================
 # BULK UPLOAD SERVICE (.txt / .docx → USER TABLE)
@@ -187,37 +414,37 @@ ALLOWED_UPLOAD_EXTENSIONS = (".txt", ".docx")
 
 
 class UserDictionaryBulkUploadService:
-    WORD_RE = re.compile(r"\w+", re.UNICODE)
-
-    @staticmethod
-    def _extract_text_from_txt(file_obj: io.IOBase) -> str:
-        try:
-            file_obj.seek(0)
-        except Exception:
-            pass
-        stream = getattr(file_obj, "stream", file_obj)
-        data = stream.read()
-        if isinstance(data, bytes):
-            data = data.decode("utf-8", errors="ignore")
-        return data
-
     @staticmethod
-    def _extract_text_from_docx(file_obj: io.IOBase) -> str:
+    def _count_words(file_obj, filename: str) -> Counter:
+        """
+        Stream the file's words into a word -> count map. Memory grows
+        with the vocabulary, not the file size.
+        """
         stream = getattr(file_obj, "stream", file_obj)
         try:
             stream.seek(0)
         except Exception:
             pass
-        document = Document(stream)
-        return "\n".join(p.text for p in document.paragraphs)
+        return count_file_words(stream, filename, errors="ignore")
 
     @classmethod
-    def _tokenize_and_normalize(cls, text: str) -> list[str]:
-        raw_tokens = cls.WORD_RE.findall(text)
-        return [normalize_word(t) for t in raw_tokens if normalize_word(t)]
-
-    @classmethod
-    def process_file(cls, file_obj, filename: str, added_by: str | None = None) -> dict:
+    def process_file(
+        cls,
+        file_obj,
+        filename: str,
+        added_by: str | None = None,
+        bump_main_frequency: bool = False,
+        progress=None
+    ) -> dict:
+        """
+        Tokenize an uploaded file and upsert its words with their counts.
+        Words already in the main dictionary are filtered out first (and,
+        with bump_main_frequency, counted there instead).
+
+        progress(percent, message), if given, is called as stages finish
+        (used by background upload jobs).
+        """
+        progress = progress or (lambda percent, message: None)
         filename_lower = (filename or "").lower()
         logger.info(f"Processing uploaded file: {filename_lower!r}")
 
@@ -226,60 +453,83 @@ class UserDictionaryBulkUploadService:
                 f"Unsupported file type: {filename!r}. Only .txt and .docx are allowed."
             )
 
-        text = (
-            cls._extract_text_from_txt(file_obj)
-            if filename_lower.endswith(".txt")
-            else cls._extract_text_from_docx(file_obj)
-        )
+        freq_map = cls._count_words(file_obj, filename_lower)
+        total_tokens = freq_map.total()
+        progress(20, f"{len(freq_map)} unique words found")
 
-        tokens = cls._tokenize_and_normalize(text)
-        freq_map = Counter(tokens)
+        # Prefilter: bloom + exact snapshot, DB only for what they cannot answer
+        known = MainDictionaryBloom.resolve(freq_map, MainDictionaryService.existing_words)
+        known_counts = {word: freq_map.pop(word) for word in list(freq_map) if word in known}
 
         result = {
             "file": filename,
-            "total_tokens": len(tokens),
-            "unique_words": len(freq_map),
+            "total_tokens": total_tokens,
+            "unique_words": len(freq_map) + len(known_counts),
+            "in_main_dictionary": list(known_counts),
+            "in_main_dictionary_tokens": sum(known_counts.values()),
+            "main_frequency_bumped": bool(bump_main_frequency and known_counts),
             "inserted": [],
             "updated": [],
             "skipped": [],
             "errors": [],
         }
 
+        # Spellings that differ only in case are one row under the column's
+        # case-insensitive collation: count them under the first one seen
+        grouped = {}
         for word, count in freq_map.items():
+            if len(word) > WORD_MAX_LENGTH:
+                result["skipped"].append(word)
+                continue
+            folded = word.casefold()
+            if folded in grouped:
+                grouped[folded][1] += count
+            else:
+                grouped[folded] = [word, count]
+        items = [tuple(item) for item in grouped.values()]
+
+        # One upsert per chunk, all in one transaction. A failing chunk is
+        # rolled back to its savepoint and reported under errors.
+        for done, chunk in enumerate(chunked(items, LOOKUP_CHUNK_SIZE)):
+            saved = done * LOOKUP_CHUNK_SIZE
+            progress(25 + 70 * saved // len(items), f"Saving words ({saved}/{len(items)})")
+            words = [word for word, _ in chunk]
             try:
-                existing = (
-                    UserAddedWord.query
-                    .filter(collate(UserAddedWord.word, "utf8mb4_unicode_ci") == word)
-                    .first()
-                )
-                if existing:
-                    existing.frequency = (existing.frequency or 0) + count
-                    db.session.add(existing)
+                with db.session.begin_nested():
+                    existing = UserDictionaryService.existing_words(words)
+                    upsert_increment(UserAddedWord, [
+                        {"word": word, "added_by": added_by, "verified": False, "frequency": count}
+                        for word, count in chunk
+                    ])
+            except SQLAlchemyError as e:
+                logger.error(f"Failed to upsert {len(words)} words: {e}")
+                result["errors"].extend({"word": word, "error": str(e)} for word in words)
+                continue
+
+            existing_folded = {word.casefold() for word in existing}
+            for word in words:
+                if word in existing or word.casefold() in existing_folded:
                     result["updated"].append(word)
                 else:
-                    db.session.add(
-                        UserAddedWord(
-                            word=word,
-                            added_by=added_by,
-                            verified=False,
-                            frequency=count,
-                        )
-                    )
                     result["inserted"].append(word)
-                db.session.commit()
-            except IntegrityError as e:
-                db.session.rollback()
-                logger.warning(f"IntegrityError for word '{word}': {e}")
-                result["skipped"].append(word)
-            except Exception as e:
-                db.session.rollback()
-                logger.error(f"Failed to upsert word '{word}': {e}")
-                result["errors"].append({"word": word, "error": str(e)})
+
+        try:
+            db.session.commit()
+        except SQLAlchemyError:
+            db.session.rollback()
+            raise
+
+        user_word_cache.invalidate(result["inserted"] + result["updated"])
+        UserDictionaryBloom.add_words(result["inserted"])
+
+        if result["main_frequency_bumped"]:
+            MainDictionaryService.add_frequencies(known_counts)
 
         logger.info(
             f"Processed uploaded file '{filename}' -> "
             f"{result['total_tokens']} tokens, "
             f"{result['unique_words']} unique, "
+            f"{len(result['in_main_dictionary'])} already in main dictionary, "
             f"{len(result['inserted'])} inserted, "
             f"{len(result['updated'])} updated, "
             f"{len(result['errors'])} errors."
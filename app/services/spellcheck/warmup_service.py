@@ -0,0 +1,139 @@
+import time
+from datetime import datetime
+from threading import Lock, Thread
+
+from app.models.spellcheck import ist_now
+from app.services.spellcheck.autocomplete_service import AutocompleteService
+from app.services.spellcheck.suggestion_service import SuggestionService
+from app.utils.logger import setup_logger
+from app.utils.utils import MainDictionaryBloom, UserDictionaryBloom
+
+logger = setup_logger(name="DictionaryWarmupService")
+
+
+class DictionaryWarmupService:
+    """
+    Loads the in-memory dictionary structures in a background thread at
+    startup, so the first requests do not pay for a table scan and the
+    load balancer can wait for /ready before sending spellcheck traffic.
+    /ready waits for the dictionary filters only; the optional indexes
+    are loaded after them and reported separately.
+
+    Must be started in each worker process (threads do not survive fork).
+    """
+    _lock = Lock()
+    _thread: Thread | None = None
+    _ready: bool = False
+    _started_at: datetime | None = None
+    _finished_at: datetime | None = None
+    _duration_ms: float | None = None
+    _attempts: int = 0
+    _last_error: str | None = None
+    _tasks: dict = {}
+    _indexes: dict = {}
+
+    RETRY_DELAY_SECONDS = 30
+
+    # (name, loader, stats key counting its rows), loaded in order
+    TASKS = [
+        ("main_dictionary", MainDictionaryBloom, "words_loaded"),
+        ("user_dictionary", UserDictionaryBloom, "words_loaded"),
+    ]
+
+    # Derived from the main dictionary snapshot, so loaded after TASKS.
+    # They do not hold /ready back: their routes answer 503 until loaded.
+    INDEX_TASKS = [
+        ("suggestion_index", SuggestionService, "indexed_words"),
+        ("autocomplete_index", AutocompleteService, "indexed_words"),
+    ]
+
+    # -------------------------------------------------
+    # START
+    # -------------------------------------------------
+    @classmethod
+    def start(cls, app):
+        with cls._lock:
+            if cls._thread and cls._thread.is_alive():
+                return
+            cls._thread = Thread(target=cls._run, args=(app,), name="dictionary-warmup", daemon=True)
+            cls._thread.start()
+
+    @classmethod
+    def _run(cls, app):
+        cls._started_at = ist_now()
+        started = time.perf_counter()
+
+        cls._attempts = cls._load_tasks(app, cls.TASKS, cls._tasks)
+
+        cls._duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        cls._finished_at = ist_now()
+        cls._ready = True
+        logger.info(f"Dictionary warm-up finished in {cls._duration_ms} ms")
+
+        cls._load_tasks(app, cls.INDEX_TASKS, cls._indexes)
+
+    @classmethod
+    def _load_tasks(cls, app, tasks: list, results: dict) -> int:
+        """
+        Load tasks in order, retrying from the first unloaded one on
+        failure. Returns the number of attempts.
+        """
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                with app.app_context():
+                    for name, loader, rows_key in tasks:
+                        cls._load_task(name, loader, rows_key, results)
+                cls._last_error = None
+                return attempts
+            except Exception as e:
+                cls._last_error = str(e)
+                logger.exception(
+                    f"Dictionary warm-up failed (attempt {attempts}), "
+                    f"retrying in {cls.RETRY_DELAY_SECONDS}s: {e}"
+                )
+                time.sleep(cls.RETRY_DELAY_SECONDS)
+
+    @staticmethod
+    def _load_task(name: str, loader, rows_key: str, results: dict):
+        if results.get(name, {}).get("ready"):
+            return
+
+        started = time.perf_counter()
+        loader.warm_start()
+        duration_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        stats = loader.stats()
+        results[name] = {
+            "ready": True,
+            "load_duration_ms": duration_ms,
+            "rows_loaded": stats.get(rows_key),
+            "loaded_from": stats.get("loaded_from"),
+        }
+        logger.info(f"Warm-up task '{name}' loaded {stats.get(rows_key)} rows in {duration_ms} ms")
+
+    # -------------------------------------------------
+    # STATUS
+    # -------------------------------------------------
+    @classmethod
+    def is_ready(cls) -> bool:
+        return cls._ready
+
+    @classmethod
+    def status(cls) -> dict:
+        return {
+            "ready": cls._ready,
+            "started_at": cls._started_at.isoformat() if cls._started_at else None,
+            "finished_at": cls._finished_at.isoformat() if cls._finished_at else None,
+            "load_duration_ms": cls._duration_ms,
+            "rows_loaded": sum(task.get("rows_loaded") or 0 for task in cls._tasks.values()),
+            "attempts": cls._attempts,
+            "last_error": cls._last_error,
+            "tasks": cls._tasks,
+            # Not part of readiness
+            "indexes": {
+                name: cls._indexes.get(name, {"ready": False})
+                for name, _, _ in cls.INDEX_TASKS
+            },
+        }
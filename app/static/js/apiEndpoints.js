@@ -35,6 +35,15 @@ const API_ENDPOINTS = {
     SORT_DOC: {
         SORT_DOC: `${BASE_URL}/sort-doc`,
         UPLOAD_FILE: `${BASE_URL}/api/v1/sort-doc/upload`,
+        UPLOAD_BATCH: `${BASE_URL}/api/v1/sort-doc/upload-batch`,
+    },
+
+    // ----------------------------------
+    // ⏳ Background Upload Jobs
+    // ----------------------------------
+    JOBS: {
+        STATUS: (jobId) => `${BASE_URL}/api/v1/jobs/${jobId}`,
+        RESULT: (jobId) => `${BASE_URL}/api/v1/jobs/${jobId}/result`,
     },
 
     // ----------------------------------
@@ -51,8 +60,23 @@ const API_ENDPOINTS = {
             `${BASE_URL}/api/v1/dictionary/main/increment/${encodeURIComponent(word)}`,
         CHECK: (word) =>
             `${BASE_URL}/api/v1/dictionary/main/check/${encodeURIComponent(word)}`,
+        CHECK_BATCH: `${BASE_URL}/api/v1/dictionary/main/check`,
         BLOOM_RELOAD: `${BASE_URL}/api/v1/dictionary/main/bloom/reload`,
         BLOOM_STATS: `${BASE_URL}/api/v1/dictionary/main/bloom/stats`,
+        READY: `${BASE_URL}/api/v1/dictionary/main/ready`,
+        CACHE_STATS: `${BASE_URL}/api/v1/dictionary/main/cache/stats`,
+        FREQUENCY_STATS: `${BASE_URL}/api/v1/dictionary/main/frequency/stats`,
+    },
+
+    // ----------------------------------
+    // 🔎 Dictionary – LOOKUP (main + user)
+    // ----------------------------------
+    DICTIONARY: {
+        LOOKUP: `${BASE_URL}/api/v1/dictionary/lookup`,
+        SUGGEST: `${BASE_URL}/api/v1/dictionary/suggest`,
+        SUGGEST_STATS: `${BASE_URL}/api/v1/dictionary/suggest/stats`,
+        AUTOCOMPLETE: `${BASE_URL}/api/v1/dictionary/autocomplete`,
+        AUTOCOMPLETE_STATS: `${BASE_URL}/api/v1/dictionary/autocomplete/stats`,
     },
 
     // ----------------------------------
@@ -62,6 +86,7 @@ const API_ENDPOINTS = {
         ADD: `${BASE_URL}/api/v1/dictionary/user/add`,
         LIST_PENDING: `${BASE_URL}/api/v1/dictionary/user/pending`,
         APPROVE: `${BASE_URL}/api/v1/dictionary/user/approve`,
+        APPROVE_FILTER: `${BASE_URL}/api/v1/dictionary/user/approve-filter`,
         DELETE: `${BASE_URL}/api/v1/dictionary/user/delete`,
     },
 };
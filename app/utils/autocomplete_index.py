@@ -0,0 +1,71 @@
+import heapq
+from array import array
+
+from app.utils.dictionary_snapshot import WordSnapshot
+
+
+class AutocompleteIndex:
+    """
+    Top-k completions for a prefix over a WordSnapshot, ranked by the
+    frequency stored in the snapshot.
+
+    Words sharing a prefix form one contiguous range of the sorted
+    snapshot, found with two binary searches. Ranges larger than
+    `scan_limit` words (short, common prefixes) have their top `top_k`
+    positions precomputed; smaller ranges are ranked on the fly. Either
+    way a query touches at most scan_limit words, whatever the table size.
+    """
+
+    __slots__ = ("snapshot", "top_k", "scan_limit", "_top")
+
+    def __init__(self, snapshot: WordSnapshot, top_k: int, scan_limit: int, top: dict[str, array]):
+        self.snapshot = snapshot
+        self.top_k = top_k
+        self.scan_limit = scan_limit
+        self._top = top
+
+    @classmethod
+    def build(cls, snapshot: WordSnapshot, top_k: int = 20, scan_limit: int = 1000) -> "AutocompleteIndex":
+        frequency_at = snapshot.frequency_at
+        top = {}
+
+        # Walk the implicit trie, descending only into ranges too large to scan
+        stack = [("", 0, len(snapshot))]
+        while stack:
+            prefix, start, end = stack.pop()
+            if end - start <= scan_limit:
+                continue
+            if prefix:
+                top[prefix] = array("I", heapq.nlargest(top_k, range(start, end), key=frequency_at))
+
+            depth = len(prefix) + 1
+            position = start
+            while position < end:
+                child = snapshot.word_at(position)[:depth]
+                if len(child) < depth:
+                    # The prefix itself is a word
+                    position += 1
+                    continue
+                child_end = snapshot.prefix_range(child)[1]
+                stack.append((child, position, child_end))
+                position = child_end
+
+        return cls(snapshot, top_k, scan_limit, top)
+
+    def complete(self, prefix: str, limit: int) -> list[tuple[str, int]]:
+        """Return up to limit (word, frequency) pairs, most frequent first."""
+        snapshot = self.snapshot
+        positions = self._top.get(prefix)
+
+        # Every range larger than scan_limit has a precomputed entry
+        if positions is None:
+            start, end = snapshot.prefix_range(prefix)
+            positions = heapq.nlargest(limit, range(start, end), key=snapshot.frequency_at)
+
+        return [(snapshot.word_at(i), snapshot.frequency_at(i)) for i in positions[:limit]]
+
+    def precomputed_prefixes(self) -> int:
+        return len(self._top)
+
+    def memory_bytes(self) -> int:
+        return sum(len(positions) * 4 + len(prefix.encode("utf-8")) for prefix, positions in self._top.items())
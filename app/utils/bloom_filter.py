@@ -0,0 +1,62 @@
+import math
+from hashlib import blake2b
+
+
+class BloomFilter:
+    """
+    Plain bit-array bloom filter with a stable hash.
+
+    Unlike rbloom's default (Python's per-process salted hash()), the bit
+    positions only depend on the word, so the bit array can be written to
+    disk and loaded by another process. Positions use double hashing over
+    a 128-bit blake2b digest.
+    """
+
+    __slots__ = ("_bits", "num_bits", "num_hashes")
+
+    def __init__(self, num_bits: int, num_hashes: int, bits=None):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self._bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float) -> "BloomFilter":
+        capacity = max(capacity, 1)
+        num_bits = math.ceil(-(capacity * math.log(error_rate)) / (math.log(2) ** 2))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(num_bits, num_hashes)
+
+    # -------------------------------------------------
+    # HASHING
+    # -------------------------------------------------
+    def _positions(self, word: str):
+        digest = blake2b(word.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    # -------------------------------------------------
+    # OPERATIONS
+    # -------------------------------------------------
+    def add(self, word: str):
+        bits = self._bits
+        for position in self._positions(word):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, word: str) -> bool:
+        bits = self._bits
+        for position in self._positions(word):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def size_in_bits(self) -> int:
+        return self.num_bits
+
+    @property
+    def bits(self):
+        """Underlying byte buffer (for persistence)."""
+        return self._bits
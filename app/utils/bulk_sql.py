@@ -0,0 +1,126 @@
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+
+from app.config.database import kagapa_tools_db as db
+
+# Dialect-specific INSERT constructs (ON DUPLICATE KEY / ON CONFLICT support)
+_INSERTS = {
+    "mysql": mysql.insert,
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def chunked(items: list, size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def dialect_insert(model):
+    """INSERT for model's table in the dialect of the current session."""
+    dialect = db.session.get_bind().dialect.name
+    try:
+        return _INSERTS[dialect](model.__table__)
+    except KeyError:
+        raise NotImplementedError(f"Bulk insert is not supported on {dialect}")
+
+
+def insert_ignore(model, rows: list[dict]) -> int:
+    """
+    Insert rows in one statement, skipping those that hit a unique key.
+    Returns the number of rows actually inserted.
+    """
+    stmt = dialect_insert(model)
+    if db.session.get_bind().dialect.name == "mysql":
+        stmt = stmt.prefix_with("IGNORE")
+    else:
+        stmt = stmt.on_conflict_do_nothing()
+    return db.session.execute(stmt, rows).rowcount
+
+
+def upsert_increment(model, rows: list[dict], column: str = "frequency", index_elements=("word",)) -> int:
+    """
+    Insert rows in one statement; for rows that hit the unique key, add the
+    row's `column` value to the stored one instead (MySQL
+    ON DUPLICATE KEY UPDATE col = col + VALUES(col), ON CONFLICT DO UPDATE
+    elsewhere). updated_at is refreshed on both paths.
+    """
+    table = model.__table__
+    stmt = dialect_insert(model)
+
+    if db.session.get_bind().dialect.name == "mysql":
+        stmt = stmt.on_duplicate_key_update({
+            column: table.c[column] + stmt.inserted[column],
+            "updated_at": stmt.inserted.updated_at,
+        })
+    else:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(index_elements),
+            set_={
+                column: table.c[column] + stmt.excluded[column],
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+    return db.session.execute(stmt, rows).rowcount
+
+
+def insert_new_rows(model, rows: list[dict], key: str = "word") -> set:
+    """
+    Insert rows, skipping duplicates, and return the keys that were inserted.
+
+    The whole batch is tried as one INSERT IGNORE / ON CONFLICT DO NOTHING
+    inside a savepoint. If the row count shows that some rows were skipped
+    (a concurrent insert, or a duplicate under the column collation), the
+    savepoint is rolled back and the batch is replayed row by row to learn
+    exactly which ones. The caller commits.
+    """
+    if not rows:
+        return set()
+
+    savepoint = db.session.begin_nested()
+    if insert_ignore(model, rows) == len(rows):
+        savepoint.commit()
+        return {row[key] for row in rows}
+    savepoint.rollback()
+
+    inserted = set()
+    for row in rows:
+        try:
+            with db.session.begin_nested():
+                db.session.execute(model.__table__.insert(), [row])
+            inserted.add(row[key])
+        except IntegrityError:
+            pass
+    return inserted
+
+
+def delete_words(model, words: list[str], chunk_size: int, match_column=None) -> tuple[list[str], set[str]]:
+    """
+    Delete the rows whose word matches one of words: per chunk, one
+    pre-select and one DELETE ... WHERE word IN (...). Runs in the
+    caller's transaction.
+
+    match_column (default model.word) can carry an explicit collation.
+    Returns (stored words that were deleted, input words that matched a row).
+    Under a case-insensitive collation the stored form may differ from the
+    input, so inputs are matched to rows by case-folded value too.
+    """
+    match_column = model.word if match_column is None else match_column
+    deleted = []
+    matched = set()
+
+    for chunk in chunked(words, chunk_size):
+        found = [word for (word,) in db.session.query(model.word).filter(match_column.in_(chunk))]
+        if not found:
+            continue
+
+        db.session.query(model).filter(model.word.in_(found)).delete(synchronize_session=False)
+        deleted.extend(found)
+
+        found_folded = {word.casefold() for word in found}
+        matched.update(
+            word for word in chunk
+            if word in found or word.casefold() in found_folded
+        )
+
+    return deleted, matched
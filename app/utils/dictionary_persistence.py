@@ -0,0 +1,317 @@
+import glob
+import json
+import mmap
+import os
+import sys
+import zlib
+from contextlib import contextmanager
+
+from app.utils.bloom_filter import BloomFilter
+from app.utils.dictionary_snapshot import WordSnapshot
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms (no prefork workers)
+    fcntl = None
+
+# File layout (every section starts on an 8 byte boundary):
+#   MAGIC | uint32 header length | JSON header
+#   | bloom bits | snapshot offsets (uint32) | frequencies (uint32) | snapshot blob
+MAGIC = b"KGDICT03"
+FORMAT_VERSION = 3
+
+# Suggestion index (one per dictionary generation):
+#   SUGGEST_MAGIC | uint32 header length | JSON header | keys (uint64)
+SUGGEST_MAGIC = b"KGSUGG01"
+
+DICTIONARY_CACHE_DIR = os.getenv("DICTIONARY_CACHE_DIR", "dictionary_cache")
+
+
+def snapshot_path(name: str) -> str:
+    return os.path.join(DICTIONARY_CACHE_DIR, f"{name}.bin")
+
+
+def journal_path(name: str, generation: str) -> str:
+    return os.path.join(DICTIONARY_CACHE_DIR, f"{name}.{generation}.journal")
+
+
+def lock_path(name: str, purpose: str) -> str:
+    return os.path.join(DICTIONARY_CACHE_DIR, f"{name}.{purpose}.lock")
+
+
+def suggestion_index_path(name: str, generation: str, metric: str) -> str:
+    return os.path.join(DICTIONARY_CACHE_DIR, f"{name}.{generation}.{metric}.suggest")
+
+
+def _pad(length: int) -> bytes:
+    return b"\0" * ((8 - length % 8) % 8)
+
+
+def _checksum(*buffers) -> int:
+    checksum = 0
+    for buffer in buffers:
+        checksum = zlib.crc32(buffer, checksum)
+    return checksum
+
+
+def _write_file(path: str, magic: bytes, header: dict, sections: list):
+    """
+    Write magic, the JSON header and the sections (each padded to 8 bytes)
+    to a temp file and atomically swap it into place.
+    """
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_bytes += b" " * ((8 - (len(magic) + 4 + len(header_bytes)) % 8) % 8)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    with open(tmp_path, "wb") as f:
+        f.write(magic)
+        f.write(len(header_bytes).to_bytes(4, "little"))
+        f.write(header_bytes)
+        for i, section in enumerate(sections):
+            f.write(section)
+            if i < len(sections) - 1:
+                f.write(_pad(len(section)))
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+
+
+def _map_file(path: str, magic: bytes) -> tuple[mmap.mmap, dict, int] | None:
+    """Map path read-only and parse its header; returns (mapping, header, data start)."""
+    try:
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if mapping[:len(magic)] != magic:
+        return None
+
+    position = len(magic)
+    header_len = int.from_bytes(mapping[position:position + 4], "little")
+    position += 4
+
+    try:
+        header = json.loads(mapping[position:position + header_len])
+    except ValueError:
+        return None
+
+    if header.get("byteorder") != sys.byteorder:
+        return None
+
+    return mapping, header, position + header_len
+
+
+# -------------------------------------------------
+# CROSS-PROCESS LOCK
+# -------------------------------------------------
+@contextmanager
+def file_lock(path: str, shared: bool = False):
+    """flock() based lock shared by all worker processes on this host."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+# -------------------------------------------------
+# DICTIONARY FILE
+# -------------------------------------------------
+def save_dictionary_file(path: str, bloom: BloomFilter, snapshot: WordSnapshot, meta: dict):
+    """
+    Write the bloom bits, the exact snapshot and metadata (count, capacity,
+    error rate, DB watermark, generation) to a temp file and atomically
+    swap it into place. Processes that still map the old file keep a valid
+    view of it until they remap.
+    """
+    bloom_bytes = bytes(bloom.bits)
+    offsets_bytes = snapshot.offsets.tobytes()
+    frequencies_bytes = snapshot.frequencies.tobytes()
+    blob = snapshot.blob
+
+    header = dict(meta)
+    header.update({
+        "version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "num_bits": bloom.num_bits,
+        "num_hashes": bloom.num_hashes,
+        "bloom_bytes": len(bloom_bytes),
+        "snapshot_words": len(snapshot),
+        "blob_bytes": len(blob),
+        "crc32": _checksum(bloom_bytes, offsets_bytes, frequencies_bytes, blob),
+    })
+    _write_file(path, MAGIC, header, [bloom_bytes, offsets_bytes, frequencies_bytes, blob])
+
+
+def read_dictionary_header(path: str) -> dict | None:
+    """Read only the JSON header of a dictionary file."""
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            header_len = int.from_bytes(f.read(4), "little")
+            return json.loads(f.read(header_len))
+    except (OSError, ValueError):
+        return None
+
+
+def map_dictionary_file(path: str) -> tuple[BloomFilter, WordSnapshot, dict, int] | None:
+    """
+    Memory-map a file written by save_dictionary_file read-only.
+
+    The bloom bits and the snapshot are views over the mapping, so every
+    process mapping the same file shares one copy in the page cache.
+    Returns (bloom, snapshot, header, mapped_bytes), or None if the file is
+    missing, from another format version or corrupt.
+    """
+    mapped = _map_file(path, MAGIC)
+    if mapped is None:
+        return None
+
+    mapping, header, position = mapped
+    if header.get("version") != FORMAT_VERSION:
+        return None
+
+    bloom_start = position
+    bloom_end = bloom_start + header["bloom_bytes"]
+    offsets_start = bloom_end + len(_pad(header["bloom_bytes"]))
+    offsets_len = (header["snapshot_words"] + 1) * 4
+    offsets_end = offsets_start + offsets_len
+    frequencies_start = offsets_end + len(_pad(offsets_len))
+    frequencies_len = header["snapshot_words"] * 4
+    frequencies_end = frequencies_start + frequencies_len
+    blob_start = frequencies_end + len(_pad(frequencies_len))
+    blob_end = blob_start + header["blob_bytes"]
+
+    if len(mapping) != blob_end:
+        return None
+
+    view = memoryview(mapping)
+    bloom_bits = view[bloom_start:bloom_end]
+    offsets = view[offsets_start:offsets_end].cast("I")
+    frequencies = view[frequencies_start:frequencies_end].cast("I")
+
+    checksum = _checksum(
+        bloom_bits,
+        view[offsets_start:offsets_end],
+        view[frequencies_start:frequencies_end],
+        view[blob_start:blob_end]
+    )
+    if checksum != header["crc32"]:
+        return None
+
+    bloom = BloomFilter(header["num_bits"], header["num_hashes"], bloom_bits)
+    snapshot = WordSnapshot(mapping, offsets, base=blob_start, frequencies=frequencies)
+
+    return bloom, snapshot, header, len(mapping)
+
+
+# -------------------------------------------------
+# SUGGESTION INDEX FILE
+# -------------------------------------------------
+def save_suggestion_index(path: str, keys, meta: dict):
+    """Write the sorted uint64 keys of a suggestion index plus its metadata."""
+    keys_bytes = keys.tobytes()
+    header = dict(meta)
+    header.update({
+        "byteorder": sys.byteorder,
+        "entries": len(keys),
+        "crc32": _checksum(keys_bytes),
+    })
+    _write_file(path, SUGGEST_MAGIC, header, [keys_bytes])
+
+
+def map_suggestion_index(path: str) -> tuple[memoryview, dict, int] | None:
+    """
+    Memory-map a file written by save_suggestion_index read-only.
+    Returns (keys, header, mapped_bytes), or None if missing or corrupt.
+    """
+    mapped = _map_file(path, SUGGEST_MAGIC)
+    if mapped is None:
+        return None
+
+    mapping, header, position = mapped
+    keys_end = position + header["entries"] * 8
+    if len(mapping) != keys_end:
+        return None
+
+    keys = memoryview(mapping)[position:keys_end]
+    if _checksum(keys) != header["crc32"]:
+        return None
+
+    return keys.cast("Q"), header, len(mapping)
+
+
+def remove_stale_suggestion_indexes(name: str, keep_generation: str):
+    """Delete suggestion indexes of older generations (mapped copies stay valid)."""
+    keep = os.path.join(DICTIONARY_CACHE_DIR, f"{name}.{keep_generation}.")
+    for path in glob.glob(os.path.join(DICTIONARY_CACHE_DIR, f"{name}.*.suggest")):
+        if not path.startswith(keep):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+# -------------------------------------------------
+# WRITE JOURNAL (incremental changes shared by all workers)
+# -------------------------------------------------
+def append_journal(path: str, entries: list[tuple[str, str]]):
+    """
+    Append (op, word) entries, op being "+" or "-", as one write of JSON
+    lines, so a word containing a line break stays a single record.
+    O_APPEND keeps concurrent writers from different workers from interleaving.
+    """
+    if not entries:
+        return
+    data = "".join(
+        json.dumps([op, word], ensure_ascii=False) + "\n" for op, word in entries
+    ).encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def read_journal(path: str, offset: int) -> tuple[list[tuple[str, str]], int]:
+    """Return complete entries written after offset, and the new offset."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return [], offset
+
+    end = data.rfind(b"\n") + 1
+    entries = [
+        tuple(json.loads(line))
+        for line in data[:end].decode("utf-8").split("\n")
+        if line
+    ]
+    return entries, offset + end
+
+
+def copy_journal_tail(source: str | None, offset: int, target: str):
+    """Start target with the entries of source written after offset."""
+    data = b""
+    if source:
+        try:
+            with open(source, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            pass
+
+    with open(target, "wb") as f:
+        f.write(data[:data.rfind(b"\n") + 1])
+        f.flush()
+        os.fsync(f.fileno())
@@ -0,0 +1,148 @@
+from array import array
+
+
+class WordSnapshot:
+    """
+    Immutable, exact set of dictionary words.
+
+    Words are stored sorted (by UTF-8 bytes, which matches code point
+    order) in one contiguous blob, with an offsets table marking where
+    each word starts. Lookups are a binary search over the offsets, so
+    memory is roughly the raw UTF-8 size plus 4 bytes per word instead
+    of one Python str object per word.
+
+    An optional frequencies table (uint32, same order as the words) is
+    kept alongside for ranking.
+
+    The blob can be a bytes object or a read-only mmap of the dictionary
+    file (then `base` is the blob's position inside the mapping and the
+    offsets / frequencies are memoryviews over the same mapping).
+    """
+
+    __slots__ = ("_blob", "_base", "_offsets", "_frequencies")
+
+    def __init__(self, blob, offsets, base: int = 0, frequencies=None):
+        self._blob = blob
+        self._base = base
+        self._offsets = offsets
+        self._frequencies = frequencies
+
+    @property
+    def blob(self) -> bytes:
+        base = self._base
+        return bytes(self._blob[base:base + self._offsets[-1]])
+
+    @property
+    def offsets(self) -> array:
+        return array("I", self._offsets)
+
+    @property
+    def frequencies(self) -> array:
+        if self._frequencies is None:
+            return array("I", bytes(4 * len(self)))
+        return array("I", self._frequencies)
+
+    # -------------------------------------------------
+    # BUILD
+    # -------------------------------------------------
+    @classmethod
+    def from_pairs(cls, pairs: list[tuple[bytes, int]]) -> "WordSnapshot":
+        """
+        Build a snapshot from (UTF-8 encoded word, frequency) pairs in any
+        order. Duplicates keep their highest frequency. The list is sorted
+        in place.
+        """
+        pairs.sort()
+
+        offsets = array("I", [0])
+        frequencies = array("I")
+        parts = []
+        position = 0
+        previous = None
+
+        for encoded, frequency in pairs:
+            frequency = min(max(frequency or 0, 0), 0xFFFFFFFF)
+            if encoded == previous:
+                frequencies[-1] = max(frequencies[-1], frequency)
+                continue
+            previous = encoded
+            parts.append(encoded)
+            frequencies.append(frequency)
+            position += len(encoded)
+            offsets.append(position)
+
+        return cls(b"".join(parts), offsets, frequencies=frequencies)
+
+    # -------------------------------------------------
+    # LOOKUP
+    # -------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __contains__(self, word: str) -> bool:
+        return self.index_of(word) >= 0
+
+    def index_of(self, word: str) -> int:
+        """Return the sorted position of word, or -1 if absent."""
+        key = word.encode("utf-8")
+        blob = self._blob
+        base = self._base
+        offsets = self._offsets
+
+        lo, hi = 0, len(offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = blob[base + offsets[mid]:base + offsets[mid + 1]]
+            if current < key:
+                lo = mid + 1
+            elif current > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def prefix_range(self, prefix: str) -> tuple[int, int]:
+        """Return (start, end) positions of the words starting with prefix."""
+        key = prefix.encode("utf-8")
+        size = len(key)
+        blob = self._blob
+        base = self._base
+        offsets = self._offsets
+
+        lo, hi = 0, len(offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if blob[base + offsets[mid]:base + offsets[mid + 1]] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        start = lo
+
+        hi = len(offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if blob[base + offsets[mid]:base + offsets[mid + 1]][:size] == key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start, lo
+
+    def word_at(self, index: int) -> str:
+        base = self._base
+        offsets = self._offsets
+        return bytes(self._blob[base + offsets[index]:base + offsets[index + 1]]).decode("utf-8")
+
+    def frequency_at(self, index: int) -> int:
+        if self._frequencies is None:
+            return 0
+        return self._frequencies[index]
+
+    # -------------------------------------------------
+    # STATS
+    # -------------------------------------------------
+    def memory_bytes(self) -> int:
+        """Size of the blob, offsets and frequencies tables."""
+        size = self._offsets[-1] + len(self._offsets) * 4
+        if self._frequencies is not None:
+            size += len(self._frequencies) * 4
+        return size
@@ -0,0 +1,134 @@
+import atexit
+import time
+from collections import Counter
+from datetime import datetime
+from threading import Event, Lock, Thread
+
+from app.utils.logger import setup_logger
+
+logger = setup_logger(name="FrequencyBuffer")
+
+
+class FrequencyBuffer:
+    """
+    Write-behind counter: coalesces increments per key in memory and hands
+    them to flush_fn(counts) in one batch, every interval_seconds or as
+    soon as max_keys distinct keys are pending. The buffer is drained at
+    interpreter exit.
+
+    Until start(app) is called (e.g. in scripts), add() returns False and
+    the caller must apply the increment itself. A failed flush puts its
+    counts back so they are retried with the next one.
+    """
+
+    def __init__(self, name: str, flush_fn, max_keys: int = 5000, interval_seconds: float = 5.0):
+        self.name = name
+        self.max_keys = max_keys
+        self.interval_seconds = interval_seconds
+        self._flush_fn = flush_fn
+        self._pending: Counter = Counter()
+        self._lock = Lock()
+        self._flush_lock = Lock()
+        self._wake = Event()
+        self._stopped = Event()
+        self._thread: Thread | None = None
+        self._app = None
+        self.flushes = 0
+        self.failures = 0
+        self.flushed_keys = 0
+        self.flushed_increments = 0
+        self.last_flush_ms: float | None = None
+        self.max_flush_ms: float | None = None
+        self.last_flush_at: datetime | None = None
+
+    # -------------------------------------------------
+    # START / STOP
+    # -------------------------------------------------
+    def start(self, app):
+        """Start the flush thread (once per worker process)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._app = app
+        self._stopped.clear()
+        self._thread = Thread(target=self._run, name=f"{self.name}-frequency-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.drain)
+
+    def drain(self):
+        """Stop the flush thread and write out everything still pending."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.interval_seconds)
+        self.flush()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.interval_seconds)
+            self._wake.clear()
+            self.flush()
+
+    # -------------------------------------------------
+    # BUFFER
+    # -------------------------------------------------
+    def add(self, key, count: int = 1) -> bool:
+        """Buffer an increment; returns False if the buffer is not running."""
+        if self._thread is None or self._stopped.is_set():
+            return False
+        with self._lock:
+            self._pending[key] += count
+            full = len(self._pending) >= self.max_keys
+        if full:
+            self._wake.set()
+        return True
+
+    def flush(self) -> int:
+        """Apply pending increments now; returns the number of keys flushed."""
+        with self._flush_lock:
+            with self._lock:
+                counts, self._pending = self._pending, Counter()
+            if not counts:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                with self._app.app_context():
+                    self._flush_fn(dict(counts))
+            except Exception as e:
+                self.failures += 1
+                with self._lock:
+                    self._pending.update(counts)
+                logger.exception(f"{self.name} frequency flush failed ({len(counts)} words kept): {e}")
+                return 0
+
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+            self.flushes += 1
+            self.flushed_keys += len(counts)
+            self.flushed_increments += sum(counts.values())
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms or 0, elapsed_ms)
+            self.last_flush_at = datetime.utcnow()
+            return len(counts)
+
+    # -------------------------------------------------
+    # STATS
+    # -------------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            depth = len(self._pending)
+            pending_increments = sum(self._pending.values())
+        return {
+            "name": self.name,
+            "running": bool(self._thread and self._thread.is_alive()),
+            "depth": depth,
+            "pending_increments": pending_increments,
+            "max_keys": self.max_keys,
+            "interval_seconds": self.interval_seconds,
+            "flushes": self.flushes,
+            "failures": self.failures,
+            "flushed_words": self.flushed_keys,
+            "flushed_increments": self.flushed_increments,
+            "last_flush_ms": self.last_flush_ms,
+            "max_flush_ms": self.max_flush_ms,
+            "last_flush_utc": self.last_flush_at.isoformat() if self.last_flush_at else None,
+        }
@@ -0,0 +1,115 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+
+
+@dataclass(frozen=True, slots=True)
+class DictionaryEntry:
+    """Read-only copy of a dictionary row, safe to share across requests."""
+    word: str
+    frequency: int
+    verified: bool
+    added_by: str | None
+    created_at: datetime | None
+
+    @classmethod
+    def from_row(cls, row) -> "DictionaryEntry":
+        return cls(
+            word=row.word,
+            frequency=row.frequency,
+            verified=row.verified,
+            added_by=row.added_by,
+            created_at=row.created_at,
+        )
+
+
+class LookupCache:
+    """
+    Thread-safe, bounded read-through cache with LRU eviction and a TTL.
+
+    Negative results are cached too (value None). Writers call
+    invalidate(); a lookup that started before an invalidation will not
+    store its (possibly stale) result. The TTL bounds staleness for
+    writes made by other worker processes.
+    """
+
+    def __init__(self, name: str, max_size: int = 10_000, ttl_seconds: float = 60.0):
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    # -------------------------------------------------
+    # READ
+    # -------------------------------------------------
+    def get(self, key) -> tuple[bool, object, int]:
+        """
+        Return (hit, value, epoch). On a miss, pass epoch back to put()
+        so the result is dropped if the key was invalidated meanwhile.
+        """
+        now = time.monotonic()
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                expires_at, value = item
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value, self._epoch
+                del self._entries[key]
+                self.expirations += 1
+
+            self.misses += 1
+            return False, None, self._epoch
+
+    def put(self, key, value, epoch: int):
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    # -------------------------------------------------
+    # WRITE INVALIDATION
+    # -------------------------------------------------
+    def invalidate(self, keys):
+        with self._lock:
+            self._epoch += 1
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    # -------------------------------------------------
+    # STATS
+    # -------------------------------------------------
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,213 @@
+import zlib
+from array import array
+from bisect import bisect_left
+
+from app.utils.dictionary_persistence import map_suggestion_index, save_suggestion_index
+from app.utils.dictionary_snapshot import WordSnapshot
+from app.utils.word_sort_tools import segment_aksharas
+
+FORMAT_VERSION = 2
+
+CODEPOINT = "codepoint"
+AKSHARA = "akshara"
+
+
+def word_units(word: str, metric: str):
+    """
+    The units edits are counted in: code points (the word itself) or
+    aksharas, where a vowel sign or conjunct change is a single edit.
+    """
+    if metric == AKSHARA:
+        return tuple(segment_aksharas(word))
+    return word
+
+
+METRICS = (AKSHARA, CODEPOINT)
+
+
+def edit_distance(a, b, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent
+    transpositions) between two sequences, e.g. two strings or two lists
+    of aksharas. Returns max_distance + 1 as soon as it is exceeded.
+    """
+    if a == b:
+        return 0
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) > max_distance:
+        return max_distance + 1
+
+    # Common prefix / suffix do not change the distance
+    start = 0
+    while start < len(a) and a[start] == b[start]:
+        start += 1
+    a, b = a[start:], b[start:]
+    while a and a[-1] == b[-1]:
+        a, b = a[:-1], b[:-1]
+    if not a:
+        return len(b) if len(b) <= max_distance else max_distance + 1
+
+    before = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        char = a[i - 1]
+        row_min = i
+        for j in range(1, len(b) + 1):
+            value = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char != b[j - 1])
+            )
+            if i > 1 and j > 1 and char == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, before[j - 2] + 1)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        before, previous = previous, current
+
+    distance = previous[-1]
+    return distance if distance <= max_distance else max_distance + 1
+
+
+def delete_variants(term, max_distance: int) -> set:
+    """term plus every sequence obtained by deleting up to max_distance units."""
+    variants = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        frontier = {
+            item[:i] + item[i + 1:]
+            for item in frontier
+            for i in range(len(item))
+        } - variants
+        variants |= frontier
+    return variants
+
+
+def _variant_hash(variant) -> int:
+    # Stable across processes (unlike hash()), so the index can be shared
+    if not isinstance(variant, str):
+        variant = "\x1f".join(variant)
+    return zlib.crc32(variant.encode("utf-8"))
+
+
+class SuggestionIndex:
+    """
+    SymSpell-style deletion index over a WordSnapshot.
+
+    Every snapshot word contributes the delete variants of its first
+    prefix_length units (code points or aksharas, see word_units). Each
+    (variant, word) pair is packed into one uint64 key,
+    crc32(variant) << 32 | word position, and the keys are kept sorted in
+    a single array, so a variant's words are one bisect range.
+    Hash collisions only add candidates; callers verify the real distance.
+
+    The keys can be a bytes-backed array or a memoryview over a shared
+    mapped file (see load / save).
+    """
+
+    __slots__ = ("keys", "snapshot", "generation", "metric", "max_distance", "prefix_length", "mapped_bytes")
+
+    def __init__(
+        self,
+        keys,
+        snapshot: WordSnapshot,
+        generation: str | None,
+        metric: str,
+        max_distance: int,
+        prefix_length: int,
+        mapped_bytes: int = 0
+    ):
+        self.keys = keys
+        self.snapshot = snapshot
+        self.generation = generation
+        self.metric = metric
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.mapped_bytes = mapped_bytes
+
+    # -------------------------------------------------
+    # BUILD / PERSIST
+    # -------------------------------------------------
+    @classmethod
+    def build(
+        cls,
+        snapshot: WordSnapshot,
+        generation: str | None,
+        metric: str,
+        max_distance: int,
+        prefix_length: int
+    ) -> "SuggestionIndex":
+        # Bucket by the top hash byte so each sort stays small
+        buckets = [array("Q") for _ in range(256)]
+        for position in range(len(snapshot)):
+            prefix = word_units(snapshot.word_at(position), metric)[:prefix_length]
+            for variant in delete_variants(prefix, max_distance):
+                key = _variant_hash(variant) << 32 | position
+                buckets[key >> 56].append(key)
+
+        keys = array("Q")
+        for bucket in buckets:
+            keys.extend(sorted(bucket))
+
+        return cls(keys, snapshot, generation, metric, max_distance, prefix_length)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        snapshot: WordSnapshot,
+        generation: str,
+        metric: str,
+        max_distance: int,
+        prefix_length: int
+    ) -> "SuggestionIndex | None":
+        """Map a saved index if it matches the generation and settings."""
+        mapped = map_suggestion_index(path)
+        if mapped is None:
+            return None
+
+        keys, header, mapped_bytes = mapped
+        expected = {
+            "version": FORMAT_VERSION,
+            "generation": generation,
+            "metric": metric,
+            "max_distance": max_distance,
+            "prefix_length": prefix_length,
+            "snapshot_words": len(snapshot),
+        }
+        if any(header.get(key) != value for key, value in expected.items()):
+            return None
+
+        return cls(keys, snapshot, generation, metric, max_distance, prefix_length, mapped_bytes)
+
+    def save(self, path: str):
+        save_suggestion_index(path, self.keys, {
+            "version": FORMAT_VERSION,
+            "generation": self.generation,
+            "metric": self.metric,
+            "max_distance": self.max_distance,
+            "prefix_length": self.prefix_length,
+            "snapshot_words": len(self.snapshot),
+        })
+
+    # -------------------------------------------------
+    # LOOKUP
+    # -------------------------------------------------
+    def candidates(self, word: str, max_distance: int) -> set[int]:
+        """Snapshot positions of words that may be within max_distance of word."""
+        keys = self.keys
+        positions = set()
+        prefix = word_units(word, self.metric)[:self.prefix_length]
+        for variant in delete_variants(prefix, min(max_distance, self.max_distance)):
+            low = _variant_hash(variant) << 32
+            start = bisect_left(keys, low)
+            end = bisect_left(keys, low + (1 << 32), start)
+            positions.update(key & 0xFFFFFFFF for key in keys[start:end])
+        return positions
+
+    def memory_bytes(self) -> int:
+        return len(self.keys) * 8
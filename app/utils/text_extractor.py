@@ -0,0 +1,99 @@
+import codecs
+import re
+import zipfile
+from typing import BinaryIO, Iterator
+from xml.etree.ElementTree import ParseError, iterparse
+
+# Bytes read from a .txt file per step
+CHUNK_SIZE = 64 * 1024
+
+# WordprocessingML tags
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_BODY = f"{_W}body"
+_DOCX_PARAGRAPH = f"{_W}p"
+_DOCX_TEXT = f"{_W}t"
+_DOCX_TAB = f"{_W}tab"
+_DOCX_BREAKS = (f"{_W}br", f"{_W}cr")
+
+
+def _iter_txt(stream: BinaryIO, errors: str) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")(errors=errors)
+    while True:
+        data = stream.read(CHUNK_SIZE)
+        if not data:
+            break
+        yield decoder.decode(data)
+    yield decoder.decode(b"", final=True)
+
+
+def _iter_docx(stream: BinaryIO) -> Iterator[str]:
+    """
+    Text of word/document.xml, run by run, without building the DOM:
+    each finished top-level body element (paragraph, table) is cleared.
+    Paragraphs end with a newline; tabs and breaks become whitespace.
+    Table text is included too.
+    """
+    try:
+        archive = zipfile.ZipFile(stream)
+        xml = archive.open("word/document.xml")
+    except (zipfile.BadZipFile, KeyError):
+        raise ValueError("Invalid .docx file")
+
+    with archive, xml:
+        body = None
+        depth = 0
+        try:
+            for event, elem in iterparse(xml, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if elem.tag == _DOCX_BODY:
+                        body = elem
+                    continue
+
+                depth -= 1
+                if elem.tag == _DOCX_TEXT:
+                    if elem.text:
+                        yield elem.text
+                elif elem.tag == _DOCX_TAB:
+                    yield "\t"
+                elif elem.tag in _DOCX_BREAKS or elem.tag == _DOCX_PARAGRAPH:
+                    yield "\n"
+
+                # document > body > paragraph / table: drop what is done
+                if depth == 2 and body is not None:
+                    body.clear()
+        except (ParseError, zipfile.BadZipFile):
+            raise ValueError("Invalid .docx file")
+
+
+def iter_text(stream: BinaryIO, filename: str, errors: str = "strict") -> Iterator[str]:
+    """
+    Yield the text of a .txt (UTF-8) or .docx file in pieces, reading the
+    binary stream incrementally. errors is the UTF-8 decoding policy
+    for .txt files.
+    """
+    filename = (filename or "").lower()
+    if filename.endswith(".txt"):
+        return _iter_txt(stream, errors)
+    if filename.endswith(".docx"):
+        return _iter_docx(stream)
+    raise ValueError(f"Unsupported file type: {filename!r}. Only .txt and .docx are allowed.")
+
+
+def iter_tokens(stream: BinaryIO, filename: str, pattern: re.Pattern, errors: str = "strict") -> Iterator[str]:
+    """
+    Yield every match of pattern in the file, in order, with memory bounded
+    by the chunk size rather than the file size. A match that reaches the
+    end of a piece is held back until the next piece shows where it ends.
+    """
+    carry = ""
+    for piece in iter_text(stream, filename, errors):
+        text = carry + piece
+        carry = ""
+        for match in pattern.finditer(text):
+            if match.end() == len(text):
+                carry = match.group()
+                break
+            yield match.group()
+    if carry:
+        yield carry
@@ -0,0 +1,39 @@
+import re
+from collections import Counter
+from typing import BinaryIO, Iterable
+
+import unicodedata
+
+from app.utils.text_extractor import iter_tokens
+
+# Match English + Kannada scripts
+WORD_RE = re.compile(r"[A-Za-z\u0C80-\u0CFF]+")
+
+
+def normalize_word(word: str) -> str:
+    """
+    Unicode normalization for Kannada & mixed-language words
+    """
+    return unicodedata.normalize("NFC", word.strip())
+
+
+def count_words(tokens: Iterable[str], lowercase: bool = False) -> Counter:
+    """
+    Count raw tokens by their normalized (NFC, optionally lowercased)
+    form, in one pass and without building a token list.
+
+    Raw tokens are counted first and each distinct raw form is then
+    normalized once, instead of once per occurrence. Keys keep the order
+    in which each word first occurs.
+    """
+    counts = Counter()
+    for raw_word, count in Counter(tokens).items():
+        word = normalize_word(raw_word.lower() if lowercase else raw_word)
+        if word:
+            counts[word] += count
+    return counts
+
+
+def count_file_words(stream: BinaryIO, filename: str, lowercase: bool = False, errors: str = "strict") -> Counter:
+    """Stream a .txt / .docx file and count its words (see count_words)."""
+    return count_words(iter_tokens(stream, filename, WORD_RE, errors), lowercase)
@@ -1,33 +1,133 @@
 # services/spellcheck/utils.py
+import os
+import time
+import uuid
 from datetime import datetime
-from threading import Lock
+from threading import Lock, Thread
+from typing import Iterator
 
-import unicodedata
-from rbloom import Bloom
+from flask import current_app
+from sqlalchemy import func, or_
 
 from app.config.database import kagapa_tools_db as db
-from app.models.spellcheck import MainDictionary
+from app.models.spellcheck import MainDictionary, UserAddedWord
+from app.utils.bloom_filter import BloomFilter
+from app.utils.dictionary_persistence import (
+    append_journal,
+    copy_journal_tail,
+    file_lock,
+    journal_path,
+    lock_path,
+    map_dictionary_file,
+    read_dictionary_header,
+    read_journal,
+    save_dictionary_file,
+    snapshot_path,
+)
+from app.utils.dictionary_snapshot import WordSnapshot
 from app.utils.logger import setup_logger
+from app.utils.tokenizer import WORD_RE, normalize_word
 
-logger = setup_logger("MainDictionaryBloom")
+logger = setup_logger("DictionaryFilter")
 
 
-def normalize_word(word: str) -> str:
+def tokenize_with_positions(text: str) -> Iterator[tuple[str, int, int]]:
     """
-    Unicode normalization for Kannada & mixed-language words
+    Yield (normalized_word, start, end) for every word in text.
+    start / end are character offsets into the original text.
     """
-    return unicodedata.normalize("NFC", word.strip())
+    for match in WORD_RE.finditer(text):
+        word = normalize_word(match.group())
+        if word:
+            yield word, match.start(), match.end()
 
-class MainDictionaryBloom:
-    _bloom: Bloom | None = None
-    _lock = Lock()
+
+def word_list_error(words, max_words: int) -> str | None:
+    """
+    Why words is not a list of at most max_words strings, or None if it is.
+    """
+    if not isinstance(words, list) or not all(isinstance(word, str) for word in words):
+        return "words must be a list of strings"
+    if len(words) > max_words:
+        return f"at most {max_words} words can be sent at once"
+    return None
+
+
+class DictionaryFilter:
+    """
+    Bloom filter + exact snapshot of a dictionary table, shared by all
+    worker processes on the host. Subclasses set `model` and
+    `SNAPSHOT_NAME`; each subclass keeps its own class-level state.
+
+    A rebuild writes both structures into one file under
+    DICTIONARY_CACHE_DIR and atomically swaps it into place. Every worker
+    maps that file read-only, so memory stays flat as workers are added,
+    and notices a swap within REFRESH_INTERVAL_SECONDS.
+
+    Writes made after the last rebuild are appended to a journal that
+    belongs to the file's generation. Each worker replays it into a small
+    overlay: `_added` holds words that are not in the snapshot and
+    `_deleted` holds tombstones for snapshot words that were removed.
+    A full rebuild folds the overlay back in (compaction).
+
+    The file also carries a DB watermark (max id / max updated_at), so a
+    restart can map it and replay only the rows changed since then
+    (see warm_start).
+
+    Capacity is sized from the row count plus GROWTH_HEADROOM. When writes
+    push the fill ratio past MAX_FILL_RATIO (or the overlay needs
+    compaction) a rebuild is started in the background.
+    """
+    _bloom: BloomFilter | None = None
+    # (snapshot, metadata) of one install, replaced as a single attribute
+    # so readers never pair a snapshot with another generation's metadata
+    _view: tuple[WordSnapshot | None, dict] = (None, {})
+    _added: set[str] = set()
+    _deleted: set[str] = set()
+    _lock: Lock
+    _rebuild_lock: Lock
+    # In-process writes made while a rebuild scans the table:
+    # (op, word, journaled), or None when no rebuild is running
+    _rebuild_log: list[tuple[str, str, bool]] | None = None
     _count: int = 0
     _capacity: int = 0
     _error_rate: float = 0.0
     _last_reload: datetime | None = None
+    _loaded_from: str | None = None
 
-    DEFAULT_CAPACITY = 1_000_000
+    # Shared file state
+    _file_key: tuple | None = None
+    _mapped_bytes: int = 0
+    _journal_offset: int = 0
+    _next_refresh: float = 0.0
+
+    # Telemetry (per worker)
+    _bloom_negatives: int = 0
+    _bloom_positives: int = 0
+    _false_positives: int = 0
+    _auto_rebuilds: int = 0
+    _rebuild_thread: Thread | None = None
+
+    model = None
+    SNAPSHOT_NAME: str = ""
+    MIN_CAPACITY = 100_000
+    GROWTH_HEADROOM = 0.5
+    MAX_FILL_RATIO = 0.9
     DEFAULT_ERROR_RATE = 0.001
+    # Recommend a rebuild once the overlay exceeds this fraction of the
+    # snapshot and holds at least COMPACTION_MIN_OVERLAY words, so small
+    # tables are not rebuilt on nearly every write
+    COMPACTION_RATIO = 0.05
+    COMPACTION_MIN_OVERLAY = 5_000
+    # How often lookups check for a swapped file / new journal entries
+    REFRESH_INTERVAL_SECONDS = 1.0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # One lock per dictionary, not shared through the base class.
+        # Lock order: _rebuild_lock, "rebuild" file lock, _lock, "switch" file lock
+        cls._lock = Lock()
+        cls._rebuild_lock = Lock()
 
     # -------------------------------------------------
     # LOAD / RELOAD FROM DB
@@ -35,38 +135,466 @@ class MainDictionaryBloom:
     @classmethod
     def reload_from_db(
         cls,
-        capacity: int = DEFAULT_CAPACITY,
-        error_rate: float = DEFAULT_ERROR_RATE
+        capacity: int | None = None,
+        error_rate: float = DEFAULT_ERROR_RATE,
+        if_generation: str | None = None
     ):
+        """
+        Full rebuild. capacity defaults to the current row count plus
+        GROWTH_HEADROOM. With if_generation, the rebuild is skipped when
+        another worker has already replaced that generation.
+
+        The table is scanned without holding _lock, so writes and lookups
+        carry on while a rebuild runs.
+        """
+        with cls._rebuild_lock, file_lock(lock_path(cls.SNAPSHOT_NAME, "rebuild")):
+            if if_generation is not None:
+                header = read_dictionary_header(snapshot_path(cls.SNAPSHOT_NAME))
+                if header and header.get("generation") != if_generation:
+                    logger.info(f"{cls.__name__} already rebuilt by another worker, skipping")
+                    with cls._lock:
+                        cls._refresh_locked()
+                    return
+
+            cls._rebuild(capacity, error_rate)
+
+    @classmethod
+    def sized_capacity(cls, rows: int) -> int:
+        return max(cls.MIN_CAPACITY, int(rows * (1 + cls.GROWTH_HEADROOM)))
+
+    @classmethod
+    def _rebuild(cls, capacity: int | None, error_rate: float):
+        """
+        Scan the table into a new generation and install it. Callers hold
+        _rebuild_lock and the "rebuild" file lock; _lock is only taken to
+        install the result.
+        """
+        with cls._lock:
+            cls._rebuild_log = []
+        try:
+            cls._rebuild_unlocked(capacity, error_rate)
+        finally:
+            with cls._lock:
+                cls._rebuild_log = None
+
+    @classmethod
+    def _rebuild_unlocked(cls, capacity: int | None, error_rate: float):
+        path = snapshot_path(cls.SNAPSHOT_NAME)
+
+        if capacity is None:
+            rows = db.session.query(func.count(cls.model.id)).scalar()
+            capacity = cls.sized_capacity(rows)
+
+        logger.info(f"Rebuilding {cls.__name__} (capacity={capacity})...")
+
+        # Journal entries written after this point may not be in the scan;
+        # they are carried over into the new generation's journal.
+        old_header = read_dictionary_header(path)
+        old_journal = journal_path(cls.SNAPSHOT_NAME, old_header["generation"]) if old_header else None
+        journal_start = os.path.getsize(old_journal) if old_journal and os.path.exists(old_journal) else 0
+
+        bloom = BloomFilter.for_capacity(capacity, error_rate)
+        pairs = []
+
+        query = (
+            db.session.query(cls.model.id, cls.model.word, cls.model.frequency, cls.model.updated_at)
+            .yield_per(10_000)
+        )
+
+        count = 0
+        max_id = 0
+        max_updated_at = None
+        for word_id, word, frequency, updated_at in query:
+            word = normalize_word(word)
+            bloom.add(word)
+            pairs.append((word.encode("utf-8"), frequency))
+            count += 1
+            max_id = max(max_id, word_id)
+            if updated_at and (max_updated_at is None or updated_at > max_updated_at):
+                max_updated_at = updated_at
+
+        snapshot = WordSnapshot.from_pairs(pairs)
+        del pairs
+
+        generation = uuid.uuid4().hex
+        meta = {
+            "generation": generation,
+            "rows": count,
+            "capacity": capacity,
+            "error_rate": error_rate,
+            "max_id": max_id,
+            "max_updated_at": max_updated_at.isoformat() if max_updated_at else None,
+            "saved_at_utc": datetime.utcnow().isoformat(),
+        }
+
+        try:
+            # Writers hold this lock shared while appending, so no entry can
+            # land in the old journal after its tail has been copied.
+            with file_lock(lock_path(cls.SNAPSHOT_NAME, "switch")):
+                copy_journal_tail(old_journal, journal_start, journal_path(cls.SNAPSHOT_NAME, generation))
+                save_dictionary_file(path, bloom, snapshot, meta)
+
+            if old_journal and os.path.exists(old_journal):
+                os.remove(old_journal)
+
+            with cls._lock:
+                cls._refresh_locked()
+                # Writes the journal did not carry over (the filter was
+                # not shared yet) may be missing from the scan
+                cls._replay_rebuild_log(journaled=False)
+            logger.info(f"{cls.__name__} snapshot written to {path} (generation {generation})")
+        except OSError as e:
+            # Still usable in this process, just not shared
+            logger.warning(f"Failed to write {cls.__name__} snapshot {path}: {e}")
+            with cls._lock:
+                cls._install(bloom, snapshot, meta, loaded_from="db")
+                cls._replay_rebuild_log(journaled=True)
+
+        logger.info(f"{cls.__name__} rebuild completed ({count} words loaded)")
+
+    @classmethod
+    def _replay_rebuild_log(cls, journaled: bool):
+        """
+        Apply this process's writes made during the scan to the installed
+        generation; journaled=False skips those the journal replayed.
+        """
+        for op, word, was_journaled in cls._rebuild_log or []:
+            if was_journaled and not journaled:
+                continue
+            if op == "+":
+                cls._add_locked(word)
+            else:
+                cls._remove_locked(word)
+
+    @classmethod
+    def _install(cls, bloom, snapshot, meta: dict, loaded_from: str):
+        cls._bloom = bloom
+        cls._added = set()
+        cls._deleted = set()
+        cls._view = (snapshot, meta)
+        cls._count = meta["rows"]
+        cls._capacity = meta["capacity"]
+        cls._error_rate = meta["error_rate"]
+        cls._last_reload = datetime.utcnow()
+        cls._loaded_from = loaded_from
+
+    # -------------------------------------------------
+    # SHARED FILE (mmap + journal)
+    # -------------------------------------------------
+    @classmethod
+    def _refresh_locked(cls):
+        """Map a swapped-in file and replay new journal entries."""
+        path = snapshot_path(cls.SNAPSHOT_NAME)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return
+
+        file_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if file_key != cls._file_key:
+            cls._file_key = file_key
+            mapped = map_dictionary_file(path)
+            if mapped is None:
+                logger.warning(f"Ignoring unreadable {cls.__name__} snapshot {path}")
+                return
+
+            bloom, snapshot, meta, mapped_bytes = mapped
+            cls._install(bloom, snapshot, meta, loaded_from="shared file")
+            cls._mapped_bytes = mapped_bytes
+            cls._journal_offset = 0
+
+        generation = cls._view[1].get("generation")
+        if cls._loaded_from != "shared file" or not generation:
+            return
+
+        entries, cls._journal_offset = read_journal(
+            journal_path(cls.SNAPSHOT_NAME, generation), cls._journal_offset
+        )
+        for op, word in entries:
+            if op == "+":
+                cls._add_locked(word)
+            else:
+                cls._remove_locked(word)
+
+    @classmethod
+    def _maybe_refresh(cls):
+        now = time.monotonic()
+        if now < cls._next_refresh:
+            return
+        cls._next_refresh = now + cls.REFRESH_INTERVAL_SECONDS
+
+        # Never make a lookup wait for a rebuild
+        if not cls._lock.acquire(blocking=False):
+            return
+        try:
+            cls._refresh_locked()
+        except OSError as e:
+            logger.warning(f"{cls.__name__} snapshot refresh failed: {e}")
+        finally:
+            cls._lock.release()
+
+    @classmethod
+    def _journal_locked(cls, entries: list[tuple[str, str]]):
+        journaled = False
+        try:
+            with file_lock(lock_path(cls.SNAPSHOT_NAME, "switch"), shared=True):
+                # Make sure we append to the current generation's journal
+                cls._refresh_locked()
+                generation = cls._view[1].get("generation")
+                if cls._loaded_from == "shared file" and generation:
+                    append_journal(journal_path(cls.SNAPSHOT_NAME, generation), entries)
+                    journaled = True
+        except OSError as e:
+            logger.warning(f"Failed to journal dictionary changes: {e}")
+
+        if cls._rebuild_log is not None:
+            cls._rebuild_log.extend((op, word, journaled) for op, word in entries)
+
+    # -------------------------------------------------
+    # WARM START (shared file + DB watermark replay)
+    # -------------------------------------------------
+    @classmethod
+    def warm_start(cls):
+        """
+        Map the shared file and replay rows changed since its watermark.
+
+        Deletes cannot be replayed from a watermark. If fewer rows remain
+        at or below the saved max id than the journal accounts for, we
+        fall back to a full rebuild. Workers starting together serialize
+        on the rebuild lock, so only the first one rebuilds. The DB is
+        queried without holding _lock.
+        """
+        path = snapshot_path(cls.SNAPSHOT_NAME)
+
+        with cls._rebuild_lock, file_lock(lock_path(cls.SNAPSHOT_NAME, "rebuild")):
+            with cls._lock:
+                cls._refresh_locked()
+                meta = cls._view[1]
+                loaded_from = cls._loaded_from
+                deleted = len(cls._deleted)
+
+            if loaded_from != "shared file":
+                logger.info(f"No usable {cls.__name__} snapshot at {path}, rebuilding from DB")
+                cls._rebuild(None, cls.DEFAULT_ERROR_RATE)
+                return
+
+            rows_at_watermark = (
+                db.session.query(func.count(cls.model.id))
+                .filter(cls.model.id <= meta["max_id"])
+                .scalar()
+            )
+            if rows_at_watermark != meta["rows"] - deleted:
+                logger.info(
+                    f"{cls.__name__} snapshot is stale ({meta['rows']} rows saved, "
+                    f"{deleted} journaled deletes, {rows_at_watermark} found), rebuilding from DB"
+                )
+                cls._rebuild(None, meta["error_rate"])
+                return
+
+            changed_filter = cls.model.id > meta["max_id"]
+            if meta.get("max_updated_at"):
+                changed_filter = or_(
+                    changed_filter,
+                    cls.model.updated_at >= datetime.fromisoformat(meta["max_updated_at"])
+                )
+
+            changed = [
+                normalize_word(word)
+                for (word,) in db.session.query(cls.model.word).filter(changed_filter).yield_per(10_000)
+            ]
+            with cls._lock:
+                for word in changed:
+                    cls._add_locked(word)
+            replayed = len(changed)
+
+        logger.info(
+            f"{cls.__name__} snapshot mapped from {path} "
+            f"({meta['rows']} words, {replayed} changed rows replayed)"
+        )
+
+    # -------------------------------------------------
+    # INCREMENTAL UPDATES (after a successful DB commit)
+    # -------------------------------------------------
+    @classmethod
+    def add_words(cls, words):
+        """Register words that were inserted into the table."""
+        words = [w for w in (normalize_word(raw) for raw in words) if w]
+        if not words:
+            return
+
         with cls._lock:
-            logger.info("Rebuilding MainDictionary Bloom Filter...")
+            cls._journal_locked([("+", word) for word in words])
+            if cls._bloom:
+                for word in words:
+                    cls._add_locked(word)
+
+        cls._rebuild_if_needed()
 
-            bloom = Bloom(capacity, error_rate)
+    @classmethod
+    def remove_words(cls, words):
+        """Register words that were deleted from the table."""
+        words = [w for w in (normalize_word(raw) for raw in words) if w]
+        if not words:
+            return
 
-            query = db.session.query(MainDictionary.word).yield_per(10_000)
+        with cls._lock:
+            cls._journal_locked([("-", word) for word in words])
+            if cls._bloom:
+                for word in words:
+                    cls._remove_locked(word)
+
+        cls._rebuild_if_needed()
+
+    @classmethod
+    def _add_locked(cls, word: str):
+        if word in cls._deleted:
+            cls._deleted.discard(word)
+            cls._count += 1
+        elif word not in cls._view[0] and word not in cls._added:
+            cls._added.add(word)
+            cls._count += 1
 
-            count = 0
-            for (word,) in query:
-                bloom.add(normalize_word(word))
-                count += 1
+    @classmethod
+    def _remove_locked(cls, word: str):
+        if word in cls._added:
+            cls._added.discard(word)
+            cls._count -= 1
+        elif word in cls._view[0] and word not in cls._deleted:
+            cls._deleted.add(word)
+            cls._count -= 1
 
-            cls._bloom = bloom
-            cls._count = count
-            cls._capacity = capacity
-            cls._error_rate = error_rate
-            cls._last_reload = datetime.utcnow()
+    @classmethod
+    def needs_compaction(cls) -> bool:
+        snapshot = cls._view[0]
+        if not snapshot:
+            return False
+        overlay = len(cls._added) + len(cls._deleted)
+        return overlay > max(len(snapshot) * cls.COMPACTION_RATIO, cls.COMPACTION_MIN_OVERLAY)
 
-            logger.info(f"Bloom rebuild completed ({count} words loaded)")
+    @classmethod
+    def fill_ratio(cls) -> float:
+        return cls._count / cls._capacity if cls._capacity else 0.0
+
+    # -------------------------------------------------
+    # AUTOMATIC REBUILD
+    # -------------------------------------------------
+    @classmethod
+    def _rebuild_if_needed(cls):
+        if not cls._bloom:
+            return
+
+        if cls.fill_ratio() > cls.MAX_FILL_RATIO:
+            reason = f"fill ratio {cls.fill_ratio():.2f} > {cls.MAX_FILL_RATIO}"
+        elif cls.needs_compaction():
+            reason = "overlay needs compaction"
+        else:
+            return
+
+        if cls._rebuild_thread and cls._rebuild_thread.is_alive():
+            return
+
+        try:
+            app = current_app._get_current_object()
+        except RuntimeError:
+            logger.warning(f"{cls.__name__} rebuild needed ({reason}) but no app context is available")
+            return
+
+        generation = cls._view[1].get("generation")
+
+        def rebuild():
+            with app.app_context():
+                try:
+                    cls.reload_from_db(if_generation=generation)
+                except Exception as e:
+                    logger.exception(f"Background {cls.__name__} rebuild failed: {e}")
+
+        logger.info(f"Starting background {cls.__name__} rebuild: {reason}")
+        cls._auto_rebuilds += 1
+        cls._rebuild_thread = Thread(target=rebuild, name=f"{cls.SNAPSHOT_NAME}-rebuild", daemon=True)
+        cls._rebuild_thread.start()
 
     # -------------------------------------------------
     # LOOKUP
     # -------------------------------------------------
     @classmethod
     def might_exist(cls, word: str) -> bool:
-        if not cls._bloom:
+        cls._maybe_refresh()
+        bloom = cls._bloom
+        if not bloom:
             # fail-open if not loaded yet
             return True
-        return normalize_word(word) in cls._bloom
+        word = normalize_word(word)
+        if word in cls._deleted:
+            return False
+        if word in cls._added or word in bloom:
+            return True
+        cls._bloom_negatives += 1
+        return False
+
+    @classmethod
+    def contains(cls, word: str) -> bool | None:
+        """
+        Exact in-memory membership check.
+        Returns None if the snapshot is not loaded yet (caller must ask the DB).
+        """
+        cls._maybe_refresh()
+        snapshot = cls._view[0]
+        if snapshot is None:
+            return None
+        word = normalize_word(word)
+        if word in cls._added:
+            return True
+        return word in snapshot and word not in cls._deleted
+
+    @classmethod
+    def current_view(cls) -> tuple[WordSnapshot | None, str | None, list[str]]:
+        """
+        Return (snapshot, generation, overlay additions) for structures
+        derived from the snapshot, such as the suggestion index.
+        """
+        cls._maybe_refresh()
+        # One read of _view: the snapshot and generation of the same install
+        snapshot, meta = cls._view
+        return snapshot, meta.get("generation"), list(cls._added)
+
+    @classmethod
+    def resolve(cls, words, confirm) -> set[str]:
+        """
+        Return the subset of (normalized) words present in the table.
+        Bloom negatives are dropped in memory, the exact snapshot answers
+        the rest, and only words it cannot answer (not loaded yet) are
+        passed to confirm(words) -> set, a batched DB lookup.
+        """
+        found = set()
+        candidates = []
+        positives = 0
+
+        for word in words:
+            if not cls.might_exist(word):
+                continue
+            positives += 1
+            exists = cls.contains(word)
+            if exists is None:
+                candidates.append(word)
+            elif exists:
+                found.add(word)
+
+        if candidates:
+            found.update(confirm(candidates))
+
+        cls.record_positives(positives, positives - len(found))
+        return found
+
+    @classmethod
+    def record_positives(cls, positives: int, misses: int):
+        """
+        Record how many bloom positives were confirmed (by the snapshot or
+        the DB) and how many of them turned out to be missing.
+        """
+        if not cls._bloom:
+            return
+        cls._bloom_positives += positives
+        cls._false_positives += misses
 
     # -------------------------------------------------
     # STATS / HEALTH
@@ -80,12 +608,49 @@ class MainDictionaryBloom:
         import math
         bits = -(cls._capacity * math.log(cls._error_rate)) / (math.log(2) ** 2)
         memory_mb = bits / 8 / 1024 / 1024
+        snapshot, meta = cls._view
+        bloom = cls._bloom
+
+        # Theoretical rate at the current fill vs what lookups actually saw:
+        # false positives over all lookups of absent words.
+        expected_fp = (1 - math.exp(-bloom.num_hashes * cls._count / bloom.num_bits)) ** bloom.num_hashes
+        absent_lookups = cls._false_positives + cls._bloom_negatives
+        observed_fp = cls._false_positives / absent_lookups if absent_lookups else None
 
         return {
             "loaded": True,
             "capacity": cls._capacity,
             "error_rate": cls._error_rate,
             "words_loaded": cls._count,
+            "fill_ratio": round(cls.fill_ratio(), 4),
+            "expected_false_positive_rate": round(expected_fp, 6),
+            "observed_false_positive_rate": round(observed_fp, 6) if observed_fp is not None else None,
+            "bloom_negatives": cls._bloom_negatives,
+            "bloom_positives": cls._bloom_positives,
+            "bloom_false_positives": cls._false_positives,
+            "positive_miss_ratio": round(cls._false_positives / cls._bloom_positives, 6) if cls._bloom_positives else None,
+            "auto_rebuilds": cls._auto_rebuilds,
             "memory_estimate_mb": round(memory_mb, 2),
-            "last_reload_utc": cls._last_reload.isoformat() if cls._last_reload else None
+            "bloom_memory_mb": round(cls._bloom.size_in_bits / 8 / 1024 / 1024, 2),
+            "snapshot_words": len(snapshot) if snapshot is not None else 0,
+            "snapshot_memory_mb": round(snapshot.memory_bytes() / 1024 / 1024, 2) if snapshot is not None else 0,
+            "pending_additions": len(cls._added),
+            "tombstones": len(cls._deleted),
+            "compaction_recommended": cls.needs_compaction(),
+            "last_reload_utc": cls._last_reload.isoformat() if cls._last_reload else None,
+            "loaded_from": cls._loaded_from,
+            "generation": meta.get("generation"),
+            "shared_file_mb": round(cls._mapped_bytes / 1024 / 1024, 2) if cls._loaded_from == "shared file" else 0
         }
+
+
+class MainDictionaryBloom(DictionaryFilter):
+    """Verified words (main_dictionary)."""
+    model = MainDictionary
+    SNAPSHOT_NAME = "main_dictionary"
+
+
+class UserDictionaryBloom(DictionaryFilter):
+    """Pending user-submitted words (user_added_words)."""
+    model = UserAddedWord
+    SNAPSHOT_NAME = "user_added_words"
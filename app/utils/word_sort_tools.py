@@ -1,14 +1,37 @@
 import re
 
 import unicodedata
-from docx import Document
 
-# Match English + Kannada scripts
-_WORD_RE = re.compile(r"[A-Za-z\u0C80-\u0CFF]+")
+from app.utils.tokenizer import count_file_words
 
 KANNADA_HALANT = "\u0CCD"  # Kannada Virama (Halant)
 
 
+def _char_class(ch):
+    """
+    Class of a character for akshara counting: "M" mark (Mn / Mc),
+    "H" the Kannada halant (itself a mark), "L" letter, "O" anything else.
+    """
+    if ch == KANNADA_HALANT:
+        return "H"
+    category = unicodedata.category(ch)
+    if category in ("Mn", "Mc"):
+        return "M"
+    if category.startswith("L"):
+        return "L"
+    return "O"
+
+
+# bytes.translate table indexed by the low byte of a UTF-16 code unit:
+# ASCII below 0x80, the Kannada block (U+0C80-U+0CFF) from 0x80 up.
+# Newline separates words and is kept as is.
+_BYTE_CLASSES = bytes(
+    0x0A if i == 0x0A else ord(_char_class(chr(i if i < 0x80 else 0x0C00 + i)))
+    for i in range(256)
+)
+_OUTSIDE_TABLE_RE = re.compile(r"[^\x00-\x7F\u0C80-\u0CFF]")
+
+
 def count_kannada_aksharas(word):
     count = 0
     i = 0
@@ -38,35 +61,121 @@ def count_kannada_aksharas(word):
     return count
 
 
-def extract_words_from_file(file_path):
-    ext = file_path.lower().split(".")[-1]
+def count_aksharas_batch(words):
+    """
+    count_kannada_aksharas for a whole word list, with the same results.
+
+    Words made of ASCII and Kannada characters are counted together
+    without a per-character Python loop: the joined list is mapped to a
+    string of character classes through a lookup table, the consonants
+    folded into conjuncts and the marks are dropped, and what is left of
+    each word is one character per akshara. Other words fall back to
+    count_kannada_aksharas (unicodedata).
+    """
+    words = list(words)
+    if not words:
+        return []
+
+    text = "\n".join(words)
+    if text.count("\n") == len(words) - 1 and not _OUTSIDE_TABLE_RE.search(text):
+        return _count_aksharas_in_table(text)
+
+    in_table = [i for i, word in enumerate(words) if "\n" not in word and not _OUTSIDE_TABLE_RE.search(word)]
+    counts = [None] * len(words)
+    if in_table:
+        batch = _count_aksharas_in_table("\n".join(words[i] for i in in_table))
+        for i, count in zip(in_table, batch):
+            counts[i] = count
+    for i, word in enumerate(words):
+        if counts[i] is None:
+            counts[i] = count_kannada_aksharas(word)
+    return counts
+
+
+def _count_aksharas_in_table(text):
+    """Akshara count of each newline-separated word (ASCII / Kannada only)."""
+    classes = text.encode("utf-16-be")[1::2].translate(_BYTE_CLASSES)
+
+    # A base followed by halant + consonant is one akshara: drop the
+    # consonant. Once per base: after a conjunct, count_kannada_aksharas
+    # skips the next halant as a diacritic, so in a chain every other
+    # consonant is a new base. Replacing left to right without rescanning
+    # does the same; "other" bases go first as they are never consumed.
+    classes = classes.replace(b"OHL", b"O").replace(b"LHL", b"L")
+
+    aksharas = classes.translate(None, b"MH")
+    return [len(word) for word in aksharas.split(b"\n")]
+
+
+def segment_aksharas(word):
+    """
+    Split a word into aksharas, using the same rules as
+    count_kannada_aksharas (len(segment_aksharas(w)) == count_kannada_aksharas(w)).
+
+    Vowel signs, halant + consonant conjuncts and other marks stay with
+    their base letter, e.g. "ಕನ್ನಡ" -> ["ಕ", "ನ್ನ", "ಡ"].
+    """
+    aksharas = []
+    leading_marks = ""
+    i = 0
+    length = len(word)
+
+    while i < length:
+        ch = word[i]
+
+        # Marks belong to the current akshara
+        if unicodedata.category(ch) in ("Mn", "Mc"):
+            if aksharas:
+                aksharas[-1] += ch
+            else:
+                leading_marks += ch
+            i += 1
+            continue
+
+        start = i
+        i += 1
+
+        # Halant + consonant chain (conjunct cluster) and its diacritics
+        while i < length - 1 and word[i] == KANNADA_HALANT and unicodedata.category(word[i + 1]).startswith("L"):
+            i += 2
+            while i < length and unicodedata.category(word[i]) in ("Mn", "Mc"):
+                i += 1
+
+        aksharas.append(leading_marks + word[start:i])
+        leading_marks = ""
 
-    if ext == "docx":
-        doc = Document(file_path)
-        text = " ".join(p.text for p in doc.paragraphs)
+    return aksharas
 
-    elif ext == "txt":
-        with open(file_path, "r", encoding="utf-8") as f:
-            text = f.read()
 
-    else:
+def extract_words_from_file(file_path):
+    ext = file_path.lower().split(".")[-1]
+    if ext not in ("docx", "txt"):
         return [], 0
 
-    raw_words = _WORD_RE.findall(text)
-    total_count = len(raw_words)
+    # Streamed: only the unique words are held in memory
+    with open(file_path, "rb") as f:
+        counts = count_file_words(f, file_path, lowercase=True)
+
+    return list(counts), counts.total()
 
-    normalized = [w.lower().strip() for w in raw_words if w.strip()]
-    unique_words = list(dict.fromkeys(normalized))
 
-    return unique_words, total_count
+def extract_and_count_file(file_path):
+    """
+    Unique words of a file, their akshara counts and the file's total word
+    count. Module level so a process pool can run it.
+    """
+    words, total_count = extract_words_from_file(file_path)
+    return words, count_aksharas_batch(words), total_count
 
 
-def sort_lowest_highest_words(words):
+def sort_lowest_highest_words(words, akshara_counts=None):
     if not words:
         return [], [], 0, 0
 
-    # Use Kannada-aware akshara counter
-    word_data = [(w, count_kannada_aksharas(w)) for w in words]
+    # Use Kannada-aware akshara counter (unless the counts are given)
+    if akshara_counts is None:
+        akshara_counts = count_aksharas_batch(words)
+    word_data = list(zip(words, akshara_counts))
 
     sorted_lowest = sorted(word_data, key=lambda x: (x[1], x[0]))
     sorted_highest = sorted(word_data, key=lambda x: (-x[1], x[0]))
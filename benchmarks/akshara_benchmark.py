@@ -0,0 +1,48 @@
+"""
+Akshara counting speed: count_kannada_aksharas per word versus the
+lookup-table count_aksharas_batch, on the unique words of a generated
+Kannada corpus (what sort-doc counts per upload).
+
+    python -m benchmarks.akshara_benchmark [--words N] [--file words.txt]
+"""
+import argparse
+import time
+
+from app.utils.word_sort_tools import count_aksharas_batch, count_kannada_aksharas
+from benchmarks.kannada_corpus import vocabulary
+
+
+def per_word(words: list[str]) -> list[int]:
+    return [count_kannada_aksharas(word) for word in words]
+
+
+def bench(name: str, fn, words: list[str], repeat: int) -> list[int]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        counts = fn(words)
+        best = min(best, time.perf_counter() - started)
+    print(f"{name:<24} {len(words):>9,} words  {best * 1000:8.1f} ms  {len(words) / best:>12,.0f} words/s")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--words", type=int, default=200_000, help="unique words to generate")
+    parser.add_argument("--file", help="UTF-8 file with one word per line instead")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            words = [line.strip() for line in f if line.strip()]
+    else:
+        words = vocabulary(args.words)
+
+    expected = bench("count_kannada_aksharas", per_word, words, args.repeat)
+    counts = bench("count_aksharas_batch", count_aksharas_batch, words, args.repeat)
+    assert counts == expected, "batch counts differ from count_kannada_aksharas"
+
+
+if __name__ == "__main__":
+    main()
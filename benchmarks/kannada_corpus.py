@@ -0,0 +1,42 @@
+"""
+Synthetic Kannada text for the benchmarks in this folder.
+
+Words are built from consonants, vowel signs, conjuncts (halant +
+consonant) and independent vowels, and drawn with a Zipf-like
+distribution so the text has a realistic mix of frequent and rare words.
+"""
+import random
+
+CONSONANTS = [chr(c) for c in range(0x0C95, 0x0CB9 + 1) if c not in (0x0CA9, 0x0CB4)]
+VOWELS = [chr(c) for c in range(0x0C85, 0x0C94 + 1) if c not in (0x0C8D, 0x0C91)]
+VOWEL_SIGNS = ["", "", "ಾ", "ಿ", "ೀ", "ು", "ೂ", "ೆ", "ೇ", "ೊ", "ೋ"]
+HALANT = "್"
+MARKS = ["ಂ", "ಃ"]
+
+
+def random_word(rng: random.Random) -> str:
+    parts = [rng.choice(VOWELS)] if rng.random() < 0.15 else []
+    for _ in range(rng.randint(1, 6)):
+        akshara = rng.choice(CONSONANTS)
+        if rng.random() < 0.2:
+            akshara += HALANT + rng.choice(CONSONANTS)
+        akshara += rng.choice(VOWEL_SIGNS)
+        if rng.random() < 0.05:
+            akshara += rng.choice(MARKS)
+        parts.append(akshara)
+    return "".join(parts)
+
+
+def vocabulary(size: int, seed: int = 1) -> list[str]:
+    rng = random.Random(seed)
+    return list(dict.fromkeys(random_word(rng) for _ in range(size)))
+
+
+def corpus(words: int, vocabulary_size: int = 50_000, seed: int = 1) -> str:
+    """Return about `words` words of text, with punctuation and line breaks."""
+    rng = random.Random(seed)
+    vocab = vocabulary(vocabulary_size, seed)
+    weights = [1 / rank for rank in range(1, len(vocab) + 1)]
+    separators = [" "] * 12 + [", ", ". ", "\n"]
+    tokens = rng.choices(vocab, weights=weights, k=words)
+    return "".join(token + rng.choice(separators) for token in tokens)
@@ -0,0 +1,60 @@
+"""
+Spelling suggestion latency per metric: candidates from the deletion
+index, then edit distance in code points or aksharas, on a generated
+Kannada dictionary with one-edit misspellings as queries.
+
+    python -m benchmarks.suggestion_benchmark [--words N] [--queries N]
+"""
+import argparse
+import random
+import time
+
+from app.utils.dictionary_snapshot import WordSnapshot
+from app.utils.suggestion_index import METRICS, SuggestionIndex, edit_distance, word_units
+from benchmarks.kannada_corpus import CONSONANTS, VOWEL_SIGNS, vocabulary
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word))
+    return word[:i] + rng.choice(CONSONANTS + VOWEL_SIGNS[2:]) + word[i + 1:]
+
+
+def suggest(index: SuggestionIndex, word: str, max_distance: int) -> int:
+    """What SuggestionService.suggest does per query; returns the candidate count."""
+    units = word_units(word, index.metric)
+    positions = index.candidates(word, max_distance)
+    for position in positions:
+        edit_distance(units, word_units(index.snapshot.word_at(position), index.metric), max_distance)
+    return len(positions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--words", type=int, default=100_000, help="dictionary size")
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--max-distance", type=int, default=2)
+    parser.add_argument("--prefix-length", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(2)
+    words = vocabulary(args.words)
+    snapshot = WordSnapshot.from_pairs([(word.encode("utf-8"), rng.randint(0, 100)) for word in words])
+    queries = [misspell(rng.choice(words), rng) for _ in range(args.queries)]
+
+    for metric in METRICS:
+        started = time.perf_counter()
+        index = SuggestionIndex.build(snapshot, "benchmark", metric, args.max_distance, args.prefix_length)
+        build_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        candidates = sum(suggest(index, query, args.max_distance) for query in queries)
+        per_query = (time.perf_counter() - started) / len(queries)
+
+        print(
+            f"{metric:<10} {len(snapshot):>9,} words  build {build_s:6.1f} s  "
+            f"{candidates / len(queries):8.0f} candidates/query  {per_query * 1000:7.2f} ms/query"
+        )
+
+
+if __name__ == "__main__":
+    main()
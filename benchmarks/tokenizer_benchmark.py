@@ -0,0 +1,71 @@
+"""
+Tokens/sec of the upload tokenizer on a large Kannada corpus.
+
+Compares the fused tokenize-normalize-count stage (app.utils.tokenizer)
+with the previous approach: findall into a token list, normalize_word
+twice per token, then Counter.
+
+    python -m benchmarks.tokenizer_benchmark [--words N] [--file corpus.txt]
+"""
+import argparse
+import re
+import time
+import unicodedata
+from collections import Counter
+
+from app.utils.tokenizer import WORD_RE, count_words
+from benchmarks.kannada_corpus import corpus
+
+
+def _normalize(word: str) -> str:
+    return unicodedata.normalize("NFC", word.strip())
+
+
+def previous(text: str) -> Counter:
+    word_re = re.compile(r"\w+", re.UNICODE)
+    tokens = [_normalize(t) for t in word_re.findall(text) if _normalize(t)]
+    return Counter(tokens)
+
+
+def previous_fixed_regex(text: str) -> Counter:
+    tokens = [_normalize(t) for t in WORD_RE.findall(text) if _normalize(t)]
+    return Counter(tokens)
+
+
+def fused(text: str) -> Counter:
+    return count_words(match.group() for match in WORD_RE.finditer(text))
+
+
+def bench(name: str, fn, text: str, repeat: int) -> Counter:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        counts = fn(text)
+        best = min(best, time.perf_counter() - started)
+    tokens = counts.total()
+    print(f"{name:<28} {tokens:>10,} tokens  {best * 1000:8.1f} ms  {tokens / best:>12,.0f} tokens/s")
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--words", type=int, default=1_000_000, help="size of the generated corpus")
+    parser.add_argument("--file", help="UTF-8 text file to use instead of the generated corpus")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            text = f.read()
+    else:
+        text = corpus(args.words)
+    print(f"Corpus: {len(text):,} characters")
+
+    bench("previous (\\w+)", previous, text, args.repeat)
+    expected = bench("previous (WORD_RE)", previous_fixed_regex, text, args.repeat)
+    counts = bench("fused", fused, text, args.repeat)
+    assert counts == expected, "fused counts differ from the previous stage"
+
+
+if __name__ == "__main__":
+    main()
@@ -1,78 +1,113 @@
 import os
 
-from dotenv import load_dotenv
-from flask import Flask
-
-from app.config.database import init_db
-from app.routes.manage_users.manage_users import manage_users_bp
-from app.routes.manage_users.user_login import user_login_bp
-from app.routes.sortwords.sort_doc_routes import sort_doc_bp
-from app.routes.spellcheck.main_dictionary_routes import main_dictionary_bp
-from app.routes.spellcheck.user_dictionary_routes import user_dictionary_bp
-from app.routes.web_ui_routes.template_routes import template_routes_bp
-from app.utils.logger import setup_logger
 
-# --------------------------------------------------
-# Load Environment Variables
-# --------------------------------------------------
-load_dotenv()
+def create_app():
+    from dotenv import load_dotenv
+    from flask import Flask
 
-# --------------------------------------------------
-# Logger
-# --------------------------------------------------
-logger = setup_logger("app")
+    from app.config.database import init_db
+    from app.routes.jobs.upload_job_routes import upload_jobs_bp
+    from app.routes.manage_users.manage_users import manage_users_bp
+    from app.routes.manage_users.user_login import user_login_bp
+    from app.routes.sortwords.sort_doc_routes import sort_doc_bp
+    from app.routes.spellcheck.dictionary_lookup_routes import dictionary_lookup_bp
+    from app.routes.spellcheck.main_dictionary_routes import main_dictionary_bp
+    from app.routes.spellcheck.user_dictionary_routes import user_dictionary_bp
+    from app.routes.web_ui_routes.template_routes import template_routes_bp
+    from app.services.jobs.upload_job_service import UploadJobService
+    from app.services.spellcheck.main_dictionary_service import main_frequency_buffer
+    from app.services.spellcheck.warmup_service import DictionaryWarmupService
+    from app.utils.logger import setup_logger
 
-# --------------------------------------------------
-# Base Paths
-# --------------------------------------------------
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-APP_DIR = os.path.join(BASE_DIR, "app")
+    # --------------------------------------------------
+    # Load Environment Variables
+    # --------------------------------------------------
+    load_dotenv()
 
-TEMPLATE_DIR = os.path.join(APP_DIR, "templates")
-STATIC_DIR = os.path.join(APP_DIR, "static")
-UPLOAD_DIR = os.path.join(BASE_DIR, "user_uploaded")
+    # --------------------------------------------------
+    # Logger
+    # --------------------------------------------------
+    logger = setup_logger("app")
 
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+    # --------------------------------------------------
+    # Base Paths
+    # --------------------------------------------------
+    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    APP_DIR = os.path.join(BASE_DIR, "app")
 
-# --------------------------------------------------
-# Flask App (ENTRY POINT)
-# --------------------------------------------------
-app = Flask(
-    __name__,
-    template_folder=TEMPLATE_DIR,
-    static_folder=STATIC_DIR
-)
+    TEMPLATE_DIR = os.path.join(APP_DIR, "templates")
+    STATIC_DIR = os.path.join(APP_DIR, "static")
+    UPLOAD_DIR = os.path.join(BASE_DIR, "user_uploaded")
 
-app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "utility-tools-key")
-app.config["UPLOAD_FOLDER"] = UPLOAD_DIR
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-logger.info(f"TEMPLATE_DIR = {TEMPLATE_DIR}")
-logger.info(f"STATIC_DIR   = {STATIC_DIR}")
-logger.info(f"UPLOAD_DIR   = {UPLOAD_DIR}")
+    # --------------------------------------------------
+    # Flask App
+    # --------------------------------------------------
+    app = Flask(
+        __name__,
+        template_folder=TEMPLATE_DIR,
+        static_folder=STATIC_DIR
+    )
+
+    app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "utility-tools-key")
+    app.config["UPLOAD_FOLDER"] = UPLOAD_DIR
+
+    logger.info(f"TEMPLATE_DIR = {TEMPLATE_DIR}")
+    logger.info(f"STATIC_DIR   = {STATIC_DIR}")
+    logger.info(f"UPLOAD_DIR   = {UPLOAD_DIR}")
+
+    # --------------------------------------------------
+    # Initialize Database
+    # --------------------------------------------------
+    init_db(app)
+    logger.info("Database initialized successfully")
+
+    # --------------------------------------------------
+    # Register Blueprints
+    # --------------------------------------------------
+    # UI / Web
+    app.register_blueprint(template_routes_bp, url_prefix="/")
+
+    # Auth / APIs
+    app.register_blueprint(user_login_bp, url_prefix="/api/auth")
+    app.register_blueprint(main_dictionary_bp, url_prefix="/api/v1/dictionary/main")
+    app.register_blueprint(user_dictionary_bp, url_prefix="/api/v1/dictionary/user")
+    app.register_blueprint(dictionary_lookup_bp, url_prefix="/api/v1/dictionary")
+    app.register_blueprint(manage_users_bp, url_prefix="/api/v1/users")
+    app.register_blueprint(sort_doc_bp, url_prefix="/api/v1/sort-doc")
+    app.register_blueprint(upload_jobs_bp, url_prefix="/api/v1/jobs")
+    logger.info("All blueprints registered successfully")
+
+    # --------------------------------------------------
+    # Background Dictionary Warm-up (see /api/v1/dictionary/main/ready)
+    # --------------------------------------------------
+    # Lookups fail open (go to the DB) until loading finishes
+    DictionaryWarmupService.start(app)
+
+    # Batched frequency increments (drained on shutdown)
+    main_frequency_buffer.start(app)
+
+    # Background upload jobs (?async=1 on the upload endpoints)
+    UploadJobService.start(app)
+
+    return app
 
-# --------------------------------------------------
-# Initialize Database
-# --------------------------------------------------
-init_db(app)
-logger.info("Database initialized successfully")
 
 # --------------------------------------------------
-# Register Blueprints
+# Flask App (ENTRY POINT)
 # --------------------------------------------------
-# UI / Web
-app.register_blueprint(template_routes_bp, url_prefix="/")
-
-# Auth / APIs
-app.register_blueprint(user_login_bp, url_prefix="/api/auth")
-app.register_blueprint(main_dictionary_bp, url_prefix="/api/v1/dictionary/main")
-app.register_blueprint(user_dictionary_bp, url_prefix="/api/v1/dictionary/user")
-app.register_blueprint(manage_users_bp, url_prefix="/api/v1/users")
-app.register_blueprint(sort_doc_bp, url_prefix="/api/v1/sort-doc")
-logger.info("All blueprints registered successfully")
+# Sort-doc batch workers (forkserver / spawn) import this module as
+# __mp_main__; they only need app.utils.word_sort_tools, so the app and
+# its background threads are not created there.
+if __name__ != "__mp_main__":
+    app = create_app()
 
 # --------------------------------------------------
 # App Runner
 # --------------------------------------------------
 if __name__ == "__main__":
-    logger.info("Starting Kagapa Utility Tools Web App")
+    from app.utils.logger import setup_logger
+
+    setup_logger("app").info("Starting Kagapa Utility Tools Web App")
     app.run(host="0.0.0.0", port=5000, debug=False)
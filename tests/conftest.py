@@ -0,0 +1,60 @@
+import os
+import sqlite3
+
+import pytest
+
+# Read at import time by app.security.jwt_utils
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-not-for-production")
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config.database import kagapa_tools_db as db
+from app.utils import dictionary_persistence
+from app.utils.utils import MainDictionaryBloom, UserDictionaryBloom
+
+
+@event.listens_for(Engine, "connect")
+def _register_mysql_collation(dbapi_connection, connection_record):
+    """SQLite stand-in for the case-insensitive collation the models declare."""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_collation(
+            "utf8mb4_unicode_ci",
+            lambda a, b: (a.casefold() > b.casefold()) - (a.casefold() < b.casefold())
+        )
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "dictionary_cache"
+    path.mkdir()
+    monkeypatch.setattr(dictionary_persistence, "DICTIONARY_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture
+def app(tmp_path, cache_dir, monkeypatch):
+    # Each test starts with unloaded dictionary filters
+    for filter_cls in (MainDictionaryBloom, UserDictionaryBloom):
+        for name, value in {
+            "_bloom": None,
+            "_view": (None, {}),
+            "_added": set(),
+            "_deleted": set(),
+            "_count": 0,
+            "_loaded_from": None,
+            "_file_key": None,
+            "_journal_offset": 0,
+            "_next_refresh": 0.0,
+        }.items():
+            monkeypatch.setattr(filter_cls, name, value)
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
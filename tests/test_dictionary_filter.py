@@ -0,0 +1,80 @@
+import pytest
+
+from app.config.database import kagapa_tools_db as db
+from app.models.spellcheck import MainDictionary
+from app.utils.utils import DictionaryFilter
+
+
+def make_worker():
+    """A filter with its own class-level state, like one worker process."""
+    return type("WorkerFilter", (DictionaryFilter,), {
+        "model": MainDictionary,
+        "SNAPSHOT_NAME": "test_dictionary",
+        "REFRESH_INTERVAL_SECONDS": 0,
+    })
+
+
+@pytest.fixture
+def words(app):
+    db.session.add_all(MainDictionary(word=word, verified=True) for word in ["ಮನೆ", "ಕಾಡು"])
+    db.session.commit()
+
+
+def test_removed_snapshot_word_is_tombstoned(words):
+    worker = make_worker()
+    worker.warm_start()
+    assert worker.contains("ಮನೆ") is True
+
+    worker.remove_words(["ಮನೆ"])
+
+    assert worker.contains("ಮನೆ") is False
+    assert worker.might_exist("ಮನೆ") is False
+    assert worker.contains("ಕಾಡು") is True
+
+    worker.add_words(["ಮನೆ"])
+
+    assert worker.contains("ಮನೆ") is True
+    assert worker.stats()["words_loaded"] == 2
+
+
+def test_added_word_goes_to_the_overlay(words):
+    worker = make_worker()
+    worker.warm_start()
+
+    worker.add_words(["ಹೊಸ"])
+
+    assert worker.contains("ಹೊಸ") is True
+    assert worker.might_exist("ಹೊಸ") is True
+    assert worker.current_view()[2] == ["ಹೊಸ"]
+
+    worker.remove_words(["ಹೊಸ"])
+
+    assert worker.contains("ಹೊಸ") is False
+    assert worker.current_view()[2] == []
+
+
+def test_writes_are_replayed_by_other_workers(words):
+    writer, reader = make_worker(), make_worker()
+    writer.warm_start()
+    reader.warm_start()
+    assert reader.stats()["loaded_from"] == "shared file"
+
+    db.session.add(MainDictionary(word="ಹೊಸ", verified=True))
+    db.session.query(MainDictionary).filter(MainDictionary.word == "ಕಾಡು").delete()
+    db.session.commit()
+    writer.add_words(["ಹೊಸ"])
+    writer.remove_words(["ಕಾಡು"])
+
+    assert reader.contains("ಹೊಸ") is True
+    assert reader.contains("ಕಾಡು") is False
+
+    # A worker started later maps the same file and replays the journal
+    late = make_worker()
+    late.warm_start()
+    stats = late.stats()
+    assert stats["generation"] == writer.stats()["generation"]
+    assert (stats["snapshot_words"], stats["pending_additions"], stats["tombstones"]) == (2, 1, 1)
+
+    assert late.contains("ಹೊಸ") is True
+    assert late.contains("ಕಾಡು") is False
+    assert late.contains("ಮನೆ") is True
@@ -0,0 +1,39 @@
+from app.utils.dictionary_persistence import append_journal, read_journal
+
+
+def test_journal_round_trip(tmp_path):
+    path = str(tmp_path / "words.journal")
+    append_journal(path, [("+", "ಮನೆ"), ("-", "ಕಾಡು")])
+
+    entries, offset = read_journal(path, 0)
+
+    assert entries == [("+", "ಮನೆ"), ("-", "ಕಾಡು")]
+    assert read_journal(path, offset) == ([], offset)
+
+
+def test_journal_keeps_line_breaks_inside_a_word(tmp_path):
+    path = str(tmp_path / "words.journal")
+    append_journal(path, [("+", "ಮನೆ\nಕಾಡು"), ("+", "+ಹೊಸ")])
+
+    entries, _ = read_journal(path, 0)
+
+    assert entries == [("+", "ಮನೆ\nಕಾಡು"), ("+", "+ಹೊಸ")]
+
+
+def test_journal_reads_only_new_complete_entries(tmp_path):
+    path = str(tmp_path / "words.journal")
+    append_journal(path, [("+", "ಮನೆ")])
+    _, offset = read_journal(path, 0)
+
+    append_journal(path, [("-", "ಮನೆ")])
+    with open(path, "ab") as f:
+        f.write(b'["+", "ha')  # a writer still in the middle of a record
+
+    entries, new_offset = read_journal(path, offset)
+
+    assert entries == [("-", "ಮನೆ")]
+    assert read_journal(path, new_offset) == ([], new_offset)
+
+
+def test_missing_journal_reads_empty(tmp_path):
+    assert read_journal(str(tmp_path / "missing.journal"), 7) == ([], 7)
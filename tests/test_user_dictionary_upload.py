@@ -0,0 +1,71 @@
+import io
+
+import pytest
+
+from app.config.database import kagapa_tools_db as db
+from app.models.spellcheck import MainDictionary, UserAddedWord
+from app.services.spellcheck import user_dictionary_service
+from app.services.spellcheck.user_dictionary_service import UserDictionaryBulkUploadService
+from app.utils.utils import MainDictionaryBloom, UserDictionaryBloom
+
+
+def upload(text: str, filename: str = "words.txt") -> dict:
+    return UserDictionaryBulkUploadService.process_file(
+        io.BytesIO(text.encode("utf-8")), filename, added_by="tester"
+    )
+
+
+def stored_frequencies() -> dict:
+    return {row.word: row.frequency for row in UserAddedWord.query.all()}
+
+
+@pytest.fixture
+def dictionaries(app, monkeypatch):
+    # Several upsert chunks even for a handful of words
+    monkeypatch.setattr(user_dictionary_service, "LOOKUP_CHUNK_SIZE", 2)
+
+    db.session.add(MainDictionary(word="ಮರ", verified=True))
+    db.session.add(UserAddedWord(word="ಜನ", added_by="tester", frequency=1))
+    db.session.commit()
+    MainDictionaryBloom.warm_start()
+    UserDictionaryBloom.warm_start()
+
+
+def test_chunked_upload_report(dictionaries):
+    result = upload("ಮರ ಜನ ನಗರ ನಗರ ಪದ ಜನ ಅರಸ")
+
+    assert result["total_tokens"] == 7
+    assert result["unique_words"] == 5
+    assert result["in_main_dictionary"] == ["ಮರ"]
+    assert sorted(result["inserted"]) == sorted(["ನಗರ", "ಪದ", "ಅರಸ"])
+    assert result["updated"] == ["ಜನ"]
+    assert result["skipped"] == []
+    assert result["errors"] == []
+    assert stored_frequencies() == {"ಜನ": 3, "ನಗರ": 2, "ಪದ": 1, "ಅರಸ": 1}
+    assert all(UserDictionaryBloom.contains(word) for word in result["inserted"])
+
+
+def test_over_length_words_are_skipped(dictionaries):
+    long_word = "ಅ" * 300
+
+    result = upload(f"ನಗರ {long_word}")
+
+    assert result["inserted"] == ["ನಗರ"]
+    assert result["skipped"] == [long_word]
+    assert long_word not in stored_frequencies()
+
+
+def test_case_variants_are_stored_as_one_word(dictionaries):
+    result = upload("foo bar foo Foo")
+
+    assert sorted(result["inserted"]) == ["bar", "foo"]
+    assert result["updated"] == []
+    assert stored_frequencies()["foo"] == 3
+    assert UserDictionaryBloom.contains("foo") is True
+    assert UserDictionaryBloom.contains("Foo") is False
+
+    result = upload("FOO")
+
+    assert result["inserted"] == []
+    assert result["updated"] == ["FOO"]
+    assert stored_frequencies()["foo"] == 4